@@ -1,5 +1,8 @@
 from manim import *
 import numpy as np
+from animations.labels import cached_text, name_and_angle, place_root_labels
+from animations.diagram import root_dots, scene_detail
+from unity.roots import roots_of_unity
 
 class GeometricPropertiesScene(Scene):
     def construct(self):
@@ -23,7 +26,7 @@ class GeometricPropertiesScene(Scene):
         # Unit circle with label
         circle = Circle(radius=1, color=YELLOW)
         circle.move_to(plane.get_center())
-        circle_label = Text("Unit Circle", font_size=36, color=YELLOW)
+        circle_label = cached_text("Unit Circle", font_size=36, color=YELLOW)
         circle_label.next_to(circle, UP, buff=0.5)
         self.play(Create(circle), Write(circle_label))
         self.wait()
@@ -33,34 +36,42 @@ class GeometricPropertiesScene(Scene):
         roots = []
         labels = []
         angles = []
+        # Per-root labels only while the roots are far enough apart to read them
+        level = scene_detail(n, radius=plane.get_x_unit_size())
         
-        for k in range(n):
+        # Name and angle of each root, laid out around the circle so none overlap
+        placed = place_root_labels(
+            roots_of_unity(n),
+            lambda k: name_and_angle(f"z_{k}", f"\\frac{{{k}}}{{{n}}} \\cdot 2\\pi"),
+            center=plane.get_center(),
+            radius=plane.get_x_unit_size(),
+            offset=0.25,
+        ) if level.labels else {}
+        
+        for k in range(n if level.labels else 0):
             angle = 2 * PI * k / n
             point = Dot(plane.c2p(np.cos(angle), np.sin(angle)), color=RED, radius=0.1)
-            label = MathTex(f"z_{k}", font_size=36)
-            label.next_to(point, direction=UP)
-            
-            # Add angle label
-            angle_label = MathTex(
-                f"\\frac{{{k}}}{{{n}}} \\cdot 2\\pi",
-                font_size=32,
-                color=GREEN
-            )
-            angle_label.next_to(point, direction=RIGHT)
-            
             roots.append(point)
-            labels.append(label)
-            angles.append(angle_label)
+            if k in placed:
+                label, angle_label = placed[k]
+                labels.append(label)
+                angles.append(angle_label)
             
             self.play(
                 Create(point),
-                Write(label),
-                Write(angle_label)
+                *[Write(part) for part in placed.get(k, [])]
             )
             self.wait(0.5)
+        if not level.labels:
+            dots = root_dots(roots_of_unity(n), plane.get_center(), plane.get_x_unit_size(), level, color=RED)
+            roots.append(dots)
+            self.play(Create(dots))
 
-        # Show regular polygon with animation
-        polygon = RegularPolygon(n=n, color=GREEN)
+        # Show regular polygon with animation, or the circle it becomes for large n
+        if level.polygon == "edges":
+            polygon = RegularPolygon(n=n, color=GREEN)
+        else:
+            polygon = Circle(radius=1, color=GREEN)
         polygon.move_to(plane.get_center())
         polygon_label = Text("Regular Pentagon", font_size=36, color=GREEN)
         polygon_label.next_to(polygon, DOWN, buff=0.5)
@@ -154,28 +165,25 @@ class SpecialCasesScene(Scene):
             roots = []
             labels = []
             angles = []
+            placed = place_root_labels(
+                roots_of_unity(n),
+                lambda k: name_and_angle(f"z_{k}", f"\\frac{{{k}}}{{{n}}} \\cdot 2\\pi"),
+                center=plane.get_center(),
+                radius=plane.get_x_unit_size(),
+                offset=0.25,
+            )
             for k in range(n):
                 angle = 2 * PI * k / n
                 point = Dot(plane.c2p(np.cos(angle), np.sin(angle)), color=RED, radius=0.1)
-                label = MathTex(f"z_{k}", font_size=36)
-                label.next_to(point, direction=UP)
-                
-                # Add angle label
-                angle_label = MathTex(
-                    f"\\frac{{{k}}}{{{n}}} \\cdot 2\\pi",
-                    font_size=32,
-                    color=GREEN
-                )
-                angle_label.next_to(point, direction=RIGHT)
-                
                 roots.append(point)
-                labels.append(label)
-                angles.append(angle_label)
+                if k in placed:
+                    label, angle_label = placed[k]
+                    labels.append(label)
+                    angles.append(angle_label)
                 
                 self.play(
                     Create(point),
-                    Write(label),
-                    Write(angle_label)
+                    *[Write(part) for part in placed.get(k, [])]
                 )
                 self.wait(0.5)
 
@@ -282,31 +290,28 @@ class CyclotomicPolynomialScene(Scene):
         roots = []
         labels = []
         angles = []
-        for k in range(n):
-            if np.gcd(k, n) == 1:  # Only show primitive roots
-                angle = 2 * PI * k / n
-                point = Dot(plane.c2p(np.cos(angle), np.sin(angle)), color=RED, radius=0.1)
-                label = MathTex(f"z_{k}", font_size=36)
-                label.next_to(point, direction=UP)
-                
-                # Add angle label
-                angle_label = MathTex(
-                    f"\\frac{{{k}}}{{{n}}} \\cdot 2\\pi",
-                    font_size=32,
-                    color=GREEN
-                )
-                angle_label.next_to(point, direction=RIGHT)
-                
-                roots.append(point)
+        primitive = [k for k in range(n) if np.gcd(k, n) == 1]  # Only show primitive roots
+        placed = place_root_labels(
+            roots_of_unity(n)[primitive],
+            lambda i: name_and_angle(f"z_{primitive[i]}", f"\\frac{{{primitive[i]}}}{{{n}}} \\cdot 2\\pi"),
+            center=plane.get_center(),
+            radius=plane.get_x_unit_size(),
+            offset=0.25,
+        )
+        for i, k in enumerate(primitive):
+            angle = 2 * PI * k / n
+            point = Dot(plane.c2p(np.cos(angle), np.sin(angle)), color=RED, radius=0.1)
+            roots.append(point)
+            if i in placed:
+                label, angle_label = placed[i]
                 labels.append(label)
                 angles.append(angle_label)
-                
-                self.play(
-                    Create(point),
-                    Write(label),
-                    Write(angle_label)
-                )
-                self.wait(0.5)
+            
+            self.play(
+                Create(point),
+                *[Write(part) for part in placed.get(i, [])]
+            )
+            self.wait(0.5)
 
         # Show resulting polynomial with explanation
         polynomial = MathTex(
@@ -381,16 +386,13 @@ class MinimalPolynomialScene(Scene):
         n = 3
         angle = 2 * PI / n
         point = Dot(plane.c2p(np.cos(angle), np.sin(angle)), color=RED, radius=0.1)
-        label = MathTex("\\zeta", font_size=36)
-        label.next_to(point, direction=UP)
-        
-        # Add angle label
-        angle_label = MathTex(
-            f"\\frac{{2\\pi}}{{{n}}}",
-            font_size=32,
-            color=GREEN
-        )
-        angle_label.next_to(point, direction=RIGHT)
+        label, angle_label = place_root_labels(
+            roots_of_unity(n)[1:2],
+            lambda _: name_and_angle("\\zeta", f"\\frac{{2\\pi}}{{{n}}}"),
+            center=plane.get_center(),
+            radius=plane.get_x_unit_size(),
+            offset=0.25,
+        )[0]
         
         self.play(
             Create(point),
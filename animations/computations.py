@@ -0,0 +1,161 @@
+from manim import *
+import numpy as np
+from unity.fft import evaluate_at_roots
+from unity.group import Root, RootArray
+from unity.lattice import subgroup_lattice
+
+class PolynomialEvaluationScene(Scene):
+    def construct(self):
+        # Title
+        title = Text("Evaluating Polynomials at the Roots of Unity", font_size=48)
+        title.to_edge(UP, buff=0.5)
+        self.play(Write(title))
+        self.wait()
+
+        # The polynomial we evaluate
+        coefficients = [1, 1, 0, 0.5]
+        polynomial = MathTex(r"p(z) = 1 + z + \tfrac{1}{2} z^3", font_size=40)
+        polynomial.next_to(title, DOWN, buff=0.5)
+        polynomial.to_edge(LEFT, buff=1)
+        self.play(Write(polynomial))
+        self.wait()
+
+        # Complex plane large enough to hold the values of p
+        plane = ComplexPlane(
+            x_range=[-3, 3, 1],
+            y_range=[-3, 3, 1],
+            background_line_style={
+                "stroke_opacity": 0.6,
+                "stroke_width": 1,
+            }
+        ).scale(0.9)
+        plane.shift(RIGHT * 3 + DOWN * 0.5)
+        circle = Circle(radius=plane.get_x_unit_size(), color=BLUE)
+        circle.move_to(plane.get_center())
+        self.play(Create(plane), Create(circle))
+
+        # The n = 8 roots of unity
+        n = 8
+        roots = [np.exp(2j * PI * k / n) for k in range(n)]
+        dots = VGroup(*[Dot(plane.n2p(z), color=YELLOW) for z in roots])
+        self.play(AnimationGroup(*[Create(dot) for dot in dots], lag_ratio=0.1))
+        self.wait()
+
+        # All values at once with the FFT
+        values = evaluate_at_roots(coefficients, n)
+        explanation = Text(
+            "The FFT evaluates p at all n roots at once\n"
+            "in O(n log n) instead of O(n²) steps",
+            font_size=28,
+            color=YELLOW
+        )
+        explanation.next_to(polynomial, DOWN, buff=0.8)
+        explanation.align_to(polynomial, LEFT)
+        self.play(Write(explanation))
+
+        # Move every root to its value p(z_k), leaving a trace of the path
+        targets = VGroup(*[Dot(plane.n2p(complex(value)), color=GREEN) for value in values])
+        paths = VGroup(*[
+            Arrow(plane.n2p(z), plane.n2p(complex(value)), buff=0.1, color=GREY, stroke_width=2)
+            for z, value in zip(roots, values)
+        ])
+        self.play(
+            *[Create(path) for path in paths],
+            *[Transform(dot, target) for dot, target in zip(dots, targets)],
+            run_time=3
+        )
+        self.wait()
+
+        # Table of the computed values
+        rows = VGroup(*[
+            MathTex(f"p(z_{k}) = {value.real:.2f} {'+' if value.imag >= 0 else '-'} {abs(value.imag):.2f}i",
+                    font_size=26)
+            for k, value in enumerate(values)
+        ]).arrange(DOWN, aligned_edge=LEFT, buff=0.15)
+        rows.next_to(explanation, DOWN, buff=0.5)
+        rows.align_to(explanation, LEFT)
+        self.play(Write(rows))
+        self.wait(2)
+
+        # Cleanup
+        self.play(
+            *[FadeOut(mob) for mob in self.mobjects]
+        )
+        self.wait(1)
+
+class SubgroupLatticeScene(Scene):
+    def construct(self):
+        # Title
+        title = Text("Subgroups of the nth Roots of Unity", font_size=48)
+        title.to_edge(UP, buff=0.5)
+        self.play(Write(title))
+        self.wait()
+
+        n = 12
+        lattice = subgroup_lattice(n)
+
+        # The roots on the left
+        circle = Circle(radius=2, color=BLUE)
+        circle.shift(LEFT * 3.5 + DOWN * 0.5)
+        center = circle.get_center()
+        roots = VGroup(*[
+            Dot(center + 2 * complex_to_R3(complex(z)), color=WHITE)
+            for z in RootArray.all(n)
+        ])
+        self.play(Create(circle), AnimationGroup(*[Create(dot) for dot in roots], lag_ratio=0.05))
+        self.wait()
+
+        # One subgroup per divisor, stacked by number of prime factors
+        nodes = {}
+        levels = lattice.levels()
+        for row, divisors in enumerate(levels):
+            y = -2.5 + row * 4.5 / max(len(levels) - 1, 1)
+            for column, d in enumerate(divisors):
+                x = 3.5 + (column - (len(divisors) - 1) / 2) * 1.6
+                node = MathTex(f"C_{{{d}}}", font_size=36)
+                node.move_to(RIGHT * x + UP * y)
+                nodes[int(d)] = node
+        edges = VGroup(*[
+            Line(
+                nodes[int(lattice.divisors[lower])].get_top(),
+                nodes[int(lattice.divisors[upper])].get_bottom(),
+                buff=0.1,
+                color=GREY,
+                stroke_width=2
+            )
+            for lower, upper in lattice.edges
+        ])
+        self.play(*[Write(node) for node in nodes.values()], Create(edges), run_time=2)
+        self.wait()
+
+        explanation = Text("One subgroup for every divisor of n", font_size=28, color=YELLOW)
+        explanation.to_edge(DOWN, buff=0.3)
+        self.play(Write(explanation))
+
+        # Light up each subgroup's roots
+        for d, node in nodes.items():
+            members = VGroup(*[roots[z.k] for z in lattice.subgroup(d)])
+            self.play(
+                node.animate.set_color(YELLOW),
+                members.animate.set_color(YELLOW),
+                run_time=0.6
+            )
+            self.wait(0.4)
+            self.play(node.animate.set_color(WHITE), members.animate.set_color(WHITE), run_time=0.3)
+
+        # The orbit of z_8 is the subgroup of order 3
+        generator = 8
+        orbit_text = MathTex(f"\\langle z_{{{generator}}} \\rangle = C_{{{lattice.subgroup_of(Root(generator, n))}}}",
+                             font_size=36, color=GREEN)
+        orbit_text.next_to(circle, DOWN, buff=0.3)
+        self.play(Write(orbit_text))
+        for power in lattice.orbit(generator):
+            self.play(Indicate(roots[power.k], color=GREEN), run_time=0.5)
+        self.play(nodes[lattice.subgroup_of(Root(generator, n))].animate.set_color(GREEN))
+        self.wait(2)
+
+        # Cleanup
+        self.play(
+            *[FadeOut(mob) for mob in self.mobjects]
+        )
+        self.wait(1)
@@ -1,5 +1,8 @@
 from manim import *
 import numpy as np
+from unity.group import Root, RootArray
+from unity.roots import roots_of_unity
+from animations.labels import cached_math_tex, cached_text, name_and_angle, place_root_labels
 
 class NthRootsOfUnityScene(Scene):
     def construct(self):
@@ -54,7 +57,7 @@ class NthRootsOfUnityScene(Scene):
         # Unit circle with label
         circle = Circle(radius=1, color=YELLOW)
         circle.move_to(plane.get_center())
-        circle_label = Text("Unit Circle", font_size=36, color=YELLOW)
+        circle_label = cached_text("Unit Circle", font_size=36, color=YELLOW)
         circle_label.next_to(circle, UP, buff=0.5)
         self.play(Create(circle), Write(circle_label))
         self.wait()
@@ -64,29 +67,27 @@ class NthRootsOfUnityScene(Scene):
         roots = []
         labels = []
         angles = []
+        # Name and angle of each root, laid out around the circle so none overlap
+        placed = place_root_labels(
+            roots_of_unity(n),
+            lambda k: name_and_angle(f"z_{k}", f"\\frac{{{k}}}{{{n}}} \\cdot 2\\pi"),
+            center=plane.get_center(),
+            radius=plane.get_x_unit_size(),
+            offset=0.25,
+        )
         
         for k in range(n):
             angle = 2 * PI * k / n
             point = Dot(plane.c2p(np.cos(angle), np.sin(angle)), color=RED, radius=0.1)
-            label = MathTex(f"z_{k}", font_size=36)
-            label.next_to(point, direction=UP)
-            
-            # Add angle label
-            angle_label = MathTex(
-                f"\\frac{{{k}}}{{{n}}} \\cdot 2\\pi",
-                font_size=32,
-                color=GREEN
-            )
-            angle_label.next_to(point, direction=RIGHT)
-            
             roots.append(point)
-            labels.append(label)
-            angles.append(angle_label)
+            if k in placed:
+                label, angle_label = placed[k]
+                labels.append(label)
+                angles.append(angle_label)
             
             self.play(
                 Create(point),
-                Write(label),
-                Write(angle_label)
+                *[Write(part) for part in placed.get(k, [])]
             )
             self.wait(0.5)
 
@@ -255,14 +256,20 @@ class UnityPropertiesScene(Scene):
         n = 3
         roots = []
         labels = []
+        placed = place_root_labels(
+            roots_of_unity(n),
+            lambda k: cached_math_tex(f"z_{k}", font_size=36),
+            center=plane.get_center(),
+            radius=plane.get_x_unit_size(),
+            offset=0.25,
+        )
         for k in range(n):
             angle = 2 * PI * k / n
             point = Dot(plane.c2p(np.cos(angle), np.sin(angle)), color=RED, radius=0.1)
-            label = MathTex(f"z_{k}", font_size=36)
-            label.next_to(point, direction=UP)
             roots.append(point)
-            labels.append(label)
-            self.play(Create(point), Write(label))
+            shown = [placed[k]] if k in placed else []
+            labels.extend(shown)
+            self.play(Create(point), *[Write(label) for label in shown])
             self.wait(0.5)
 
         # Show sum vector with animation
@@ -332,14 +339,20 @@ class PrimitiveRootScene(Scene):
         n = 4
         roots = []
         labels = []
-        for k in range(n):
-            angle = 2 * PI * k / n
-            point = Dot(plane.c2p(np.cos(angle), np.sin(angle)), color=RED, radius=0.1)
-            label = MathTex(f"z_{k}", font_size=36)
-            label.next_to(point, direction=UP)
+        placed = place_root_labels(
+            roots_of_unity(n),
+            lambda k: cached_math_tex(f"z_{k}", font_size=36),
+            center=plane.get_center(),
+            radius=plane.get_x_unit_size(),
+            offset=0.25,
+        )
+        for z in RootArray.all(n):
+            k = z.k
+            point = Dot(plane.n2p(complex(z)), color=RED, radius=0.1)
             roots.append(point)
-            labels.append(label)
-            self.play(Create(point), Write(label))
+            shown = [placed[k]] if k in placed else []
+            labels.extend(shown)
+            self.play(Create(point), *[Write(label) for label in shown])
             self.wait(0.5)
 
         # Highlight primitive root with animation
@@ -353,6 +366,11 @@ class PrimitiveRootScene(Scene):
         )
         self.wait()
 
+        # Its powers z_1^0, z_1^1, ... visit every root before returning to 1
+        for power in Root(1, n).orbit():
+            self.play(Indicate(roots[power.k], color=YELLOW), run_time=0.5)
+        self.wait()
+
         # Show principal root
         principal_def = MathTex(
             r"\text{Principal root: } z_0 = 1",
@@ -0,0 +1,21 @@
+import numpy as np
+from manim import DEFAULT_STROKE_WIDTH, ORIGIN, YELLOW, Circle, Dot, VGroup, VMobject, complex_to_R3, config
+
+from rendering.layout import DetailLevel, choose_detail
+
+def scene_detail(n: int, radius: float) -> DetailLevel:
+    """Level of detail for n roots on a circle of ``radius`` scene units at the current output resolution."""
+    pixels_per_unit = config.pixel_width / config.frame_width
+    return choose_detail(n, radius, pixels_per_unit)
+
+def root_dots(roots: np.ndarray, center: np.ndarray = ORIGIN, radius: float = 1.0,
+              level: DetailLevel | None = None, color=YELLOW) -> VMobject:
+    """Dots for the roots, or a single stroke along the circle once they would merge."""
+    level = level or scene_detail(len(roots), radius)
+    if level.dots == "arc":
+        circle = Circle(radius=radius, color=color, stroke_width=2 * DEFAULT_STROKE_WIDTH)
+        return circle.move_to(center)
+    return VGroup(*[
+        Dot(center + radius * complex_to_R3(z), radius=level.dot_radius, color=color)
+        for z in roots
+    ])
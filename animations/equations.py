@@ -1,27 +1,18 @@
-from sympy import Symbol, exp, I, pi
-
-# Basic variables
-n = Symbol('n')  # For representing the nth root
-k = Symbol('k')  # For the kth root
-z = Symbol('z')  # Complex variable
-
-# Fundamental nth root of unity formula
-NTH_ROOT_OF_UNITY = exp((2 * pi * I * k) / n)
+# LaTeX strings only, so that scene modules don't pay for importing SymPy.
+# The SymPy expressions live in animations.symbolic and are loaded on first
+# access through this module (see __getattr__ at the bottom).
+_SYMBOLIC_NAMES = {"n", "k", "z", "NTH_ROOT_OF_UNITY", "PRIMITIVE_ROOT", "PRINCIPAL_ROOT"}
 
 # General form for any kth nth root of unity
-KTH_ROOT_FORMULA = f"z_{k} = e^{{2\\pi i k/{n}}}"
+KTH_ROOT_FORMULA = "z_k = e^{2\\pi i k/n}"
 
 # Polar form representation
-POLAR_FORM = f"z_{k} = \\cos(\\frac{{2\\pi k}}{{{n}}}) + i\\sin(\\frac{{2\\pi k}}{{{n}}})"
+POLAR_FORM = "z_k = \\cos(\\frac{2\\pi k}{n}) + i\\sin(\\frac{2\\pi k}{n})"
 
 # Properties and equations
-UNITY_PROPERTY = f"(z_{k})^{n} = 1"
-SUM_OF_ROOTS = f"\\sum_{{{k}=0}}^{{{n}-1}} z_{k} = 0"
-PRODUCT_OF_ROOTS = f"\\prod_{{{k}=0}}^{{{n}-1}} z_{k} = (-1)^{{n+1}}"
-
-# Common specific roots
-PRIMITIVE_ROOT = exp(2 * pi * I / n)
-PRINCIPAL_ROOT = exp(2 * pi * I / n)
+UNITY_PROPERTY = "(z_k)^n = 1"
+SUM_OF_ROOTS = "\\sum_{k=0}^{n-1} z_k = 0"
+PRODUCT_OF_ROOTS = "\\prod_{k=0}^{n-1} z_k = (-1)^{n+1}"
 
 # LaTeX strings for common values
 ROOTS_OF_UNITY_TITLE = "n^{\\text{th}} \\text{ Roots of Unity}"
@@ -32,12 +23,12 @@ PROPERTIES = [
     "\\text{1. All } n^{\\text{th}} \\text{ roots lie on the unit circle}",
     "\\text{2. The roots are equally spaced by } \\frac{2\\pi}{n} \\text{ radians}",
     "\\text{3. The first root is at angle } \\frac{2\\pi}{n}",
-    f"\\text{{4. The }} k^{{\\text{{th}}}} \\text{{ root is at angle }} \\frac{{2\\pi k}}{{{n}}}"
+    "\\text{4. The } k^{\\text{th}} \\text{ root is at angle } \\frac{2\\pi k}{n}"
 ]
 
 # Geometric properties
 UNIT_CIRCLE_EQUATION = "x^2 + y^2 = 1"
-ANGLE_BETWEEN_ROOTS = f"\\frac{{2\\pi}}{{{n}}}"
+ANGLE_BETWEEN_ROOTS = "\\frac{2\\pi}{n}"
 
 # Special cases
 SQUARE_ROOTS_OF_UNITY = ["1", "-1"]
@@ -45,9 +36,15 @@ CUBE_ROOTS_OF_UNITY = ["1", "-\\frac{1}{2} + i\\frac{\\sqrt{3}}{2}", "-\\frac{1}
 FOURTH_ROOTS_OF_UNITY = ["1", "i", "-1", "-i"]
 
 # Cyclotomic polynomial related
-CYCLOTOMIC_POLYNOMIAL = f"\\Phi_{n}(x)"
-MINIMAL_POLYNOMIAL = f"x^{n} - 1"
+CYCLOTOMIC_POLYNOMIAL = "\\Phi_n(x)"
+MINIMAL_POLYNOMIAL = "x^n - 1"
 
 # Additional mathematical constants
 EULER_FORMULA = "e^{ix} = \\cos(x) + i\\sin(x)"
-DE_MOIVRE_FORMULA = f"(\\cos(\\theta) + i\\sin(\\theta))^{n} = \\cos({n}\\theta) + i\\sin({n}\\theta)"
+DE_MOIVRE_FORMULA = "(\\cos(\\theta) + i\\sin(\\theta))^n = \\cos(n\\theta) + i\\sin(n\\theta)"
+
+def __getattr__(name):
+    if name in _SYMBOLIC_NAMES:
+        from animations import symbolic
+        return getattr(symbolic, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,6 +3,8 @@ from animations.equations import (
     ROOTS_OF_UNITY_TITLE,
     PROPERTIES,
 )
+from unity.roots import roots_of_unity_batch
+from animations.labels import cached_math_tex
 
 class IntroductionScene(Scene):
     def construct(self):
@@ -204,16 +206,18 @@ class ComplexRootVisualization(Scene):
         self.wait()
 
         # Demonstrate different roots of unity
-        for n in [2, 3, 4]:
+        demo_ns = [2, 3, 4]
+        all_roots, offsets = roots_of_unity_batch(demo_ns)
+        for index, n in enumerate(demo_ns):
             # Create dots for nth roots
             roots = VGroup(*[
-                Dot(2 * complex_to_R3(np.exp(2 * PI * i * 1j / n)))
-                for i in range(n)
+                Dot(2 * complex_to_R3(z))
+                for z in all_roots[offsets[index]:offsets[index + 1]]
             ])
             
             # Create labels for angles
             angles = VGroup(*[
-                MathTex(f"\\frac{{{2}\\pi {i}}}{{{n}}}")
+                cached_math_tex(f"\\frac{{{2}\\pi {i}}}{{{n}}}")
                 for i in range(n)
             ])
             
@@ -0,0 +1,131 @@
+from collections import OrderedDict
+from typing import Callable
+
+import numpy as np
+from manim import DOWN, GREEN, ORIGIN, MathTex, Mobject, Tex, Text, VGroup
+
+from rendering.layout import label_positions, layout_labels
+
+# Prototypes kept per process; labels beyond this evict the least recently used
+MAX_CACHED_LABELS = 1024
+
+def _key_part(value) -> object:
+    # repr() elides the middle of large arrays, so arrays are keyed by their bytes
+    if isinstance(value, np.ndarray):
+        return (value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_key_part(item) for item in value))
+    return repr(value)
+
+class LabelCache:
+    """Build each distinct Text/MathTex once and hand out copies.
+
+    Constructing a Text runs a Pango layout and parses the resulting SVG, and a
+    MathTex additionally compiles LaTeX; copying the finished mobject only
+    copies its point arrays. The key is the class together with every argument
+    (content, font, font size, color, ...), so any difference in styling gives
+    a separate entry. The cached prototypes are never handed out themselves,
+    so callers are free to move, recolor or animate what they get.
+
+    Args:
+        max_entries: Number of prototypes to keep.
+    """
+
+    def __init__(self, max_entries: int = MAX_CACHED_LABELS):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._prototypes: OrderedDict[tuple, Mobject] = OrderedDict()
+
+    def get(self, cls: type[Mobject], *args, **kwargs) -> Mobject:
+        # repr() makes lists and colors usable in the key
+        key = (cls, tuple(_key_part(arg) for arg in args),
+               tuple(sorted((name, _key_part(value)) for name, value in kwargs.items())))
+        prototype = self._prototypes.get(key)
+        if prototype is None:
+            self.misses += 1
+            prototype = cls(*args, **kwargs)
+            self._prototypes[key] = prototype
+            if len(self._prototypes) > self.max_entries:
+                self._prototypes.popitem(last=False)
+        else:
+            self.hits += 1
+            self._prototypes.move_to_end(key)
+        return prototype.copy()
+
+    def clear(self) -> None:
+        self._prototypes.clear()
+
+_shared_cache = LabelCache()
+
+def cached_text(text: str, **kwargs) -> Text:
+    """Text(text, **kwargs), built once per process and copied afterwards."""
+    return _shared_cache.get(Text, text, **kwargs)
+
+def cached_math_tex(*tex_strings: str, **kwargs) -> MathTex:
+    """MathTex(*tex_strings, **kwargs), built once per process and copied afterwards."""
+    return _shared_cache.get(MathTex, *tex_strings, **kwargs)
+
+def cached_tex(*tex_strings: str, **kwargs) -> Tex:
+    """Tex(*tex_strings, **kwargs), built once per process and copied afterwards."""
+    return _shared_cache.get(Tex, *tex_strings, **kwargs)
+
+def place_root_labels(roots: np.ndarray, make_label: Callable[[int], Mobject], center: np.ndarray = ORIGIN,
+                      radius: float = 1.0, offset: float = 0.15, gap: float = 0.05) -> dict[int, Mobject]:
+    """Label roots drawn on a circle, leaving out labels that would overlap.
+
+    Positions for all n labels are computed at once from the root array, and
+    every s-th label is kept for the smallest stride s without collisions.
+    Only kept labels are built, so large n costs a bounded number of
+    mobjects. The stride is chosen for the largest label built so far and
+    chosen again whenever a newly kept label turns out larger, until every
+    kept label fits.
+
+    Args:
+        roots: The roots as complex numbers, in angular order.
+        make_label: Builds the label for index k into ``roots``.
+        center: Center of the circle in scene coordinates.
+        radius: Radius the roots are drawn at.
+        offset: Gap between the circle and the nearest edge of each label.
+        gap: Minimum space between two labels.
+
+    Returns:
+        The kept labels by index, in order.
+    """
+    built: dict[int, Mobject] = {}
+    # Label n - 1 is the first guess at the largest
+    indices = [len(roots) - 1] if len(roots) else []
+    width = height = 0.0
+    keep = None
+    while indices:
+        for k in indices:
+            if k not in built:
+                built[k] = make_label(k)
+        largest = (max([width] + [built[k].width for k in indices]),
+                   max([height] + [built[k].height for k in indices]))
+        if keep is not None and largest == (width, height):
+            break
+        width, height = largest
+        _, keep = layout_labels(roots, width, height, radius, offset, gap)
+        indices = [int(k) for k in np.flatnonzero(keep)]
+
+    labels = {k: built[k] for k in indices}
+    # Place with each label's own size
+    widths = np.array([label.width for label in labels.values()])
+    heights = np.array([label.height for label in labels.values()])
+    positions = label_positions(roots[indices], widths, heights, radius, offset)
+    for label, (x, y) in zip(labels.values(), positions):
+        label.move_to(center + np.array([x, y, 0.0]))
+    return labels
+
+def root_labels(roots: np.ndarray, make_label: Callable[[int], Mobject], center: np.ndarray = ORIGIN,
+                radius: float = 1.0, offset: float = 0.15, gap: float = 0.05) -> VGroup:
+    """The labels of place_root_labels() as one VGroup, in order of k."""
+    return VGroup(*place_root_labels(roots, make_label, center, radius, offset, gap).values())
+
+def name_and_angle(name: str, angle: str) -> VGroup:
+    """A root's name over its angle, as the concept scenes label each root they introduce."""
+    return VGroup(
+        cached_math_tex(name, font_size=36),
+        cached_math_tex(angle, font_size=32, color=GREEN),
+    ).arrange(DOWN, buff=0.1)
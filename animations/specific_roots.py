@@ -7,6 +7,10 @@ from animations.equations import (
     DE_MOIVRE_FORMULA,
     POLAR_FORM
 )
+from unity.roots import roots_of_unity, roots_of_unity_batch
+from unity.table import root_label
+from animations.labels import cached_math_tex, cached_text, root_labels
+from animations.diagram import root_dots, scene_detail
 
 class SpecificRootsScene(Scene):
     def construct(self):
@@ -31,41 +35,26 @@ class SpecificRootsScene(Scene):
             circle.move_to(plane.get_center())
             
             # Add axis labels
-            x_label = Text("Re", font_size=20)
+            x_label = cached_text("Re", font_size=20)
             x_label.next_to(plane.x_axis.get_end(), DOWN + RIGHT, buff=0.1)
             
-            y_label = Text("Im", font_size=20)
+            y_label = cached_text("Im", font_size=20)
             y_label.next_to(plane.y_axis.get_end(), UP + LEFT, buff=0.1)
             
             return VGroup(plane, circle, x_label, y_label)
 
         # Function to create root dots and labels
         def create_root_points(n, radius=1):
-            dots = VGroup()
-            labels = VGroup()
+            roots = roots_of_unity(n)
+            dots = VGroup(*[Dot(radius * complex_to_R3(z), color=YELLOW) for z in roots])
             
-            for k in range(n):
-                angle = k * 2 * PI / n
-                point = radius * complex_to_R3(np.exp(1j * angle))
-                dot = Dot(point, color=YELLOW)
-                dots.add(dot)
-                
-                # Create label based on the angle
-                if k == 0:
-                    label_text = "1"
-                elif k == n//2 and n % 2 == 0:
-                    label_text = "-1"
-                elif k == n//4 and n % 4 == 0:
-                    label_text = "i"
-                elif k == 3*n//4 and n % 4 == 0:
-                    label_text = "-i"
-                else:
-                    label_text = f"e^{{2\\pi i {k}/{n}}}"
-                
-                label = MathTex(label_text, font_size=20)
-                offset = 0.3 * np.array([np.cos(angle), np.sin(angle), 0])
-                label.next_to(dot, normalize(point) * 0.5, buff=0.1)
-                labels.add(label)
+            # Closed forms from the shared roots table, or e^{2 pi i k/n}, laid out together
+            labels = root_labels(
+                roots,
+                lambda k: cached_math_tex(root_label(n, k), font_size=20),
+                radius=radius,
+                offset=DEFAULT_DOT_RADIUS + 0.1,
+            )
             
             return dots, labels
 
@@ -203,20 +192,20 @@ class RootPatternScene(Scene):
         )
         self.wait(1)
         
-        # Demonstrate pattern for increasing n
-        for n in range(2, 9):
-            # Create dots for nth roots
+        # Demonstrate pattern for increasing n, with every root set computed at once
+        pattern_ns = range(2, 9)
+        all_roots, offsets = roots_of_unity_batch(pattern_ns)
+        for index, n in enumerate(pattern_ns):
+            # Create dots for nth roots, merged into one stroke once n outgrows the resolution
             angle = 2 * PI / n
-            dots = VGroup(*[
-                Dot(2 * complex_to_R3(np.exp(angle * i * 1j)), color=YELLOW)
-                for i in range(n)
-            ])
-            
-            # Create angle arcs to show spacing
+            level = scene_detail(n, radius=2)
+            dots = root_dots(all_roots[offsets[index]:offsets[index + 1]], radius=2, level=level, color=YELLOW)
+
+            # Create angle arcs to show spacing, while they can still be told apart
             arcs = VGroup(*[
                 Arc(radius=0.5, angle=angle * i, color=RED)
                 for i in range(1, n)
-            ])
+            ]) if level.labels else VGroup()
             
             # Show number of roots
             count_text = Text(f"n = {n}", font_size=36)
@@ -225,7 +214,7 @@ class RootPatternScene(Scene):
             # Animate
             self.play(
                 Write(count_text),
-                AnimationGroup(*[Create(dot) for dot in dots], lag_ratio=0.1),
+                AnimationGroup(*[Create(dot) for dot in dots], lag_ratio=0.1) if isinstance(dots, VGroup) else Create(dots),
                 Create(arcs)
             )
             self.wait(1)
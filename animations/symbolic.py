@@ -0,0 +1,13 @@
+from sympy import Symbol, exp, I, pi
+
+# Basic variables
+n = Symbol('n')  # For representing the nth root
+k = Symbol('k')  # For the kth root
+z = Symbol('z')  # Complex variable
+
+# Fundamental nth root of unity formula
+NTH_ROOT_OF_UNITY = exp((2 * pi * I * k) / n)
+
+# Common specific roots
+PRIMITIVE_ROOT = exp(2 * pi * I / n)
+PRINCIPAL_ROOT = exp(2 * pi * I / n)
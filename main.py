@@ -1,6 +1,10 @@
+import asyncio
+import os
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from manim import Scene, config
+import time
+from functools import partial
+from typing import Callable
+from manim import Scene, config, tempconfig
 from animations.introduction import IntroductionScene, ComplexRootVisualization
 from animations.specific_roots import SpecificRootsScene, RootPatternScene
 from animations.core_concepts import (
@@ -13,78 +17,207 @@ from animations.advanced_concepts import (
     GeometricPropertiesScene,
     SpecialCasesScene
 )
+from animations.computations import PolynomialEvaluationScene, SubgroupLatticeScene
 from slides.slide_generator import SlideGenerator
+from rendering.scheduler import RenderScheduler
+from rendering.artifacts import ArtifactStore, movie_path, open_store, scene_key
+from rendering.encoder import OffloadedFileWriter, strip_metadata
+from rendering.split import render_scene_split
+from rendering.keyframes import render_keyframes
+from rendering.service import RenderService
+from rendering.telemetry import BatchProgress, TelemetryLog, TelemetryRenderer
 
-def render_manim_scene(scene_class: type[Scene], scene_name: str = None) -> None:
+def scene_filename(scene_name: str) -> str:
+    """Convert a scene name to the file name its movie is written under."""
+    return scene_name.lower().replace(" ", "_").replace("(", "").replace(")", "")
+
+def render_manim_scene(scene_class: type[Scene], scene_name: str = None,
+                       encoder_preset: str | None = None, ranges: int | None = None,
+                       deterministic: bool = False, on_progress: Callable[[dict], None] | None = None) -> dict:
     """Render a specific Manim scene.
     
     Args:
         scene_class: The Manim scene class to render
         scene_name: Optional name to use for the output file. If None, uses the class name.
+        encoder_preset: Optional name of a preset in rendering.encoder.ENCODER_PRESETS
+            (e.g. "preview" or "final"). If given, frames are encoded in a separate
+            process while the scene keeps rendering. If None, Manim encodes in-process.
+        ranges: Optional number of animation ranges to split the scene's timeline into.
+            If given, the ranges render in parallel processes and are stitched into one movie.
+        deterministic: If True, identical scenes produce byte-identical movies: frames are
+            encoded with fixed encoder settings (the "default" preset unless another is
+            given) and the finished movie is stripped of its metadata. Partial movie files
+            are cached apart from those of normal renders. Only opaque .mp4 output is covered.
+        on_progress: Optional callback, called after every animation with the frames and
+            animations rendered so far. Not called for split renders.
+    
+    Returns:
+        Counters for the render: frames, animations, cache hits and bytes written.
     """
+    filename = None
     if scene_name:
         # Convert the scene name to a valid filename
-        filename = scene_name.lower().replace(" ", "_").replace("(", "").replace(")", "")
+        filename = scene_filename(scene_name)
         # Set the output filename in Manim's config
         config.output_file = filename
     
-    scene = scene_class()
-    scene.render()
+    if deterministic:
+        return render_manim_scene_deterministic(scene_class, filename, encoder_preset or "default", ranges, on_progress)
+    
+    if ranges:
+        movie = render_scene_split(scene_class, filename, ranges=ranges, encoder_preset=encoder_preset)
+        return {"bytes": movie.stat().st_size, "path": str(movie)}
+    
+    if encoder_preset is None:
+        renderer = TelemetryRenderer(on_progress=on_progress)
+        scene = scene_class(renderer=renderer)
+        scene.render()
+        return renderer.stats()
+    
+    renderer = TelemetryRenderer(file_writer_class=partial(OffloadedFileWriter, preset=encoder_preset),
+                                 on_progress=on_progress)
+    scene = scene_class(renderer=renderer)
+    try:
+        scene.render()
+    finally:
+        # Don't leave the encoder process behind if the scene failed mid-render
+        scene.renderer.file_writer.shutdown()
+    return renderer.stats()
+
+def render_manim_scene_deterministic(scene_class: type[Scene], filename: str | None,
+                                     encoder_preset: str, ranges: int | None,
+                                     on_progress: Callable[[dict], None] | None = None) -> dict:
+    """The deterministic branch of render_manim_scene."""
+    if ranges:
+        # render_scene_split keeps its deterministic partial movies apart itself
+        movie = render_scene_split(scene_class, filename, ranges=ranges,
+                                   encoder_preset=encoder_preset, deterministic=True)
+        strip_metadata(movie)
+        return {"bytes": movie.stat().st_size, "path": str(movie)}
+    
+    renderer = TelemetryRenderer(
+        file_writer_class=partial(OffloadedFileWriter, preset=encoder_preset, deterministic=True),
+        on_progress=on_progress,
+    )
+    # Cached partial movies from normal renders were encoded with other settings
+    with tempconfig({"partial_movie_dir": os.path.join(config.partial_movie_dir, "deterministic")}):
+        scene = scene_class(renderer=renderer)
+        try:
+            scene.render()
+        finally:
+            scene.renderer.file_writer.shutdown()
+    movie = getattr(renderer.file_writer, "movie_file_path", None)
+    if config.write_to_movie and movie and os.path.exists(movie):
+        strip_metadata(movie)
+    return renderer.stats()
 
-def render_scene_parallel(scene_info: tuple[int, str, type[Scene]]) -> tuple[int, bool, str]:
+def render_scene_parallel(scene_info: tuple[int, str, type[Scene]]) -> tuple[int, bool, str, dict]:
     """Render a single scene in parallel and return its status.
     
     Args:
         scene_info: Tuple containing (scene_number, scene_name, scene_class)
     
     Returns:
-        Tuple containing (scene_number, success, message)
+        Tuple containing (scene_number, success, message, stats)
     """
     num, name, scene_class = scene_info
+    start = time.perf_counter()
+    stats = {"pid": os.getpid()}
     try:
-        render_manim_scene(scene_class, name)
-        return num, True, f"✓ Completed scene {num}: {name}"
+        stats.update(render_manim_scene(scene_class, name))
+        success, message = True, f"✓ Completed scene {num}: {name}"
     except Exception as e:
-        return num, False, f"✗ Error rendering scene {num}: {str(e)}"
+        stats["error"] = str(e)
+        success, message = False, f"✗ Error rendering scene {num}: {str(e)}"
+    stats["seconds"] = round(time.perf_counter() - start, 2)
+    stats["fps"] = round(stats.get("frames", 0) / stats["seconds"], 1) if stats["seconds"] else 0.0
+    return num, success, message, stats
 
-def render_all_scenes(parallel: bool = True) -> None:
+def render_all_scenes(parallel: bool = True, max_workers: int | None = None,
+                      memory_limit_mb: int | None = None, store: ArtifactStore | None = None) -> None:
     """Render all available Manim scenes in sequence or parallel.
     
     Args:
         parallel: Whether to render scenes in parallel (default: True)
+        max_workers: Maximum number of concurrent renders. If None, the number of
+            concurrent renders adapts to the available CPUs and memory.
+        memory_limit_mb: Per-scene memory ceiling in MiB. A render that exceeds it
+            is stopped and reported as failed. If None, no ceiling is enforced.
+        store: Render artifacts shared across machines. Scenes the store already has
+            for the same inputs are downloaded instead of rendered, and new renders are
+            uploaded once every scene has finished. If None, the store named by the
+            UNITY_ARTIFACT_STORE environment variable is used, if any.
     """
     print("\nRendering all scenes...")
     scenes = list_available_scenes()
     total_scenes = len(scenes)
+    names = {num: name for num, name, _ in scenes}
+    progress = BatchProgress(total_scenes)
+    telemetry = TelemetryLog()
+    telemetry.emit("batch_start", total=total_scenes, parallel=parallel)
+
+    def scene_started(scene_info):
+        num = scene_info[0]
+        progress.start(num)
+        telemetry.emit("scene_start", scene=num, name=names[num])
 
+    def scene_finished(num, success, stats):
+        if store is not None and success and not stats.get("cached") and stats.get("path"):
+            store.put(keys[num], stats["path"])
+        wall = progress.finish(num, success, stats)
+        telemetry.emit("scene_finish", scene=num, name=names[num], success=success,
+                       wall_seconds=round(wall, 2), **stats)
+        telemetry.emit("progress", **progress.snapshot())
+        print(progress.describe())
+    
+    # Take every scene the artifact store has for these inputs, render the rest
+    store = store or open_store()
+    pending = scenes
+    if store is not None:
+        keys = {num: scene_key(scene_class) for num, _, scene_class in scenes}
+        available = store.prefetch(keys.values())
+        pending = []
+        for scene_info in scenes:
+            num, name, scene_class = scene_info
+            destination = movie_path(scene_class, scene_filename(name))
+            if keys[num] in available and store.fetch(keys[num], destination):
+                scene_started(scene_info)
+                print(f"\n✓ Downloaded scene {num}: {name}")
+                scene_finished(num, True, {"cached": True, "bytes": destination.stat().st_size})
+            else:
+                pending.append(scene_info)
     
     if parallel:
         print("\nRendering scenes in parallel...")
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            # Submit all scenes for parallel rendering
-            future_to_scene = {
-                executor.submit(render_scene_parallel, scene_info): scene_info
-                for scene_info in scenes
-            }
-            
-            # Process completed scenes as they finish
-            completed = 0
-            for future in as_completed(future_to_scene):
-                num, success, message = future.result()
-                print(f"\n{message}")
-                completed += 1
-                if success:
-                    print(f"Progress: {completed}/{total_scenes} scenes completed")
+        scheduler = RenderScheduler(
+            render_scene_parallel,
+            max_workers=max_workers,
+            memory_limit=memory_limit_mb * 2**20 if memory_limit_mb else None,
+        )
+        
+        # Process completed scenes as they finish; scheduler errors come without stats
+        for num, success, message, *rest in scheduler.run(pending, on_start=scene_started):
+            print(f"\n{message}")
+            stats = rest[0] if rest else {"error": message}
+            scene_finished(num, success, stats)
     else:
         print("\nRendering scenes sequentially...")
-        for i, (num, name, scene_class) in enumerate(scenes, 1):
-            print(f"\nRendering scene {i}/{total_scenes}: {name}")
-            try:
-                render_manim_scene(scene_class, name)
-                print(f"✓ Completed scene {i}/{total_scenes}")
-            except Exception as e:
-                print(f"✗ Error rendering scene {i}/{total_scenes}: {str(e)}")
+        for i, scene_info in enumerate(pending, 1):
+            print(f"\nRendering scene {i}/{len(pending)}: {scene_info[1]}")
+            scene_started(scene_info)
+            num, success, message, stats = render_scene_parallel(scene_info)
+            if success:
+                print(f"✓ Completed scene {i}/{len(pending)}")
+            else:
+                print(f"✗ Error rendering scene {i}/{len(pending)}: {stats['error']}")
+            scene_finished(num, success, stats)
     
+    if store is not None:
+        # Uploads wait until no more render processes are forked
+        for error in store.close():
+            print(f"⚠ Failed to upload a render artifact: {error}")
+    telemetry.emit("batch_finish", **progress.snapshot())
+    telemetry.close()
     print("\nAll scenes have been rendered!")
         
     # Print scene order information
@@ -94,6 +227,46 @@ def render_all_scenes(parallel: bool = True) -> None:
         print(f"{num:2d}. {name}")
     print("=" * 50)
 
+def render_scene_keyframes(scene_info: tuple[int, str, type[Scene]]) -> tuple[int, bool, str]:
+    """Fast-forward a single scene, saving only keyframes and its final frame.
+    
+    Args:
+        scene_info: Tuple containing (scene_number, scene_name, scene_class)
+    
+    Returns:
+        Tuple containing (scene_number, success, message)
+    """
+    num, name, scene_class = scene_info
+    try:
+        paths = render_keyframes(scene_class)
+        return num, True, f"✓ Checked scene {num}: {name} ({paths[-1]})"
+    except Exception as e:
+        return num, False, f"✗ Error checking scene {num}: {str(e)}"
+
+def smoke_check_all_scenes(max_workers: int | None = None) -> bool:
+    """Build every scene with animations fast-forwarded to catch errors quickly.
+    
+    Each scene's construct() runs in full, but only a few keyframes and the
+    final frame are rasterized, as PNGs under media/smoke.
+    
+    Args:
+        max_workers: Maximum number of concurrent checks. If None, adapts to
+            the available CPUs and memory.
+    
+    Returns:
+        True if every scene built successfully.
+    """
+    print("\nSmoke checking all scenes...")
+    scenes = list_available_scenes()
+    scheduler = RenderScheduler(render_scene_keyframes, max_workers=max_workers)
+    failures = 0
+    for num, success, message in scheduler.run(scenes):
+        print(message)
+        if not success:
+            failures += 1
+    print(f"\n{len(scenes) - failures}/{len(scenes)} scenes built successfully")
+    return failures == 0
+
 def list_available_scenes() -> list[tuple[int, str, type[Scene]]]:
     """List all available Manim scenes."""
     scenes = [
@@ -112,6 +285,10 @@ def list_available_scenes() -> list[tuple[int, str, type[Scene]]]:
         # Additional Visualizations
         (9, "Specific Roots of Unity", SpecificRootsScene),
         (10, "Root Pattern Visualization", RootPatternScene),
+        
+        # Computing with Roots of Unity
+        (11, "Polynomial Evaluation with the FFT", PolynomialEvaluationScene),
+        (12, "Subgroup Lattice of the Roots of Unity", SubgroupLatticeScene),
     ]
     return scenes
 
@@ -120,7 +297,7 @@ def render_slides() -> None:
     print("\nGenerating presentation slides...")
     try:
         generator = SlideGenerator()
-        generator.generate_slides()
+        generator.build_decks()
         print("\nSlides generated successfully!")
         print("You can open the presentation in your browser at: slides/output/presentation.html")
     except Exception as e:
@@ -134,9 +311,10 @@ def main():
         print("2. Generate Slides")
         print("3. Render All Scenes (Parallel)")
         print("4. Render All Scenes (Sequential)")
-        print("5. Exit")
+        print("5. Smoke Check All Scenes (Keyframes Only)")
+        print("6. Exit")
         
-        choice = input("\nEnter your choice (1-5): ").strip()
+        choice = input("\nEnter your choice (1-6): ").strip()
         
         if choice == "1":
             print("\nAvailable Manim Scenes:")
@@ -169,11 +347,21 @@ def main():
             render_all_scenes(parallel=False)
             
         elif choice == "5":
+            smoke_check_all_scenes()
+            
+        elif choice == "6":
             print("\nGoodbye!")
             sys.exit(0)
             
         else:
-            print("\nInvalid choice! Please enter 1, 2, 3, 4, or 5.")
+            print("\nInvalid choice! Please enter 1, 2, 3, 4, 5, or 6.")
 
 if __name__ == "__main__":
+    if "--serve" in sys.argv[1:]:
+        # Accept render and slide jobs from other local tools on .cache/render.sock
+        asyncio.run(RenderService().serve_forever())
+        sys.exit(0)
+    if "--smoke" in sys.argv[1:]:
+        # Non-interactive check for CI: exit status reports whether every scene built
+        sys.exit(0 if smoke_check_all_scenes() else 1)
     main()
@@ -0,0 +1,273 @@
+import hashlib
+import os
+import shutil
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable
+
+import av
+import manim
+from manim import Scene, config
+
+# Where the shared store is configured: a directory, or s3://bucket/prefix
+ARTIFACT_STORE_ENV = "UNITY_ARTIFACT_STORE"
+# Local copies of every artifact fetched or produced on this machine
+ARTIFACT_DIR = Path(".cache/artifacts")
+# Transfers to and from the shared store that run at once
+TRANSFER_WORKERS = 8
+# Packages whose source decides what a scene renders, relative to the repository root
+SOURCE_DIRS = ("animations", "unity", "rendering")
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+@lru_cache(maxsize=1)
+def _source_digest() -> str:
+    digest = hashlib.sha256()
+    found = 0
+    for directory in SOURCE_DIRS:
+        for path in sorted((PROJECT_ROOT / directory).rglob("*.py")):
+            digest.update(path.relative_to(PROJECT_ROOT).as_posix().encode())
+            digest.update(path.read_bytes())
+            found += 1
+    if not found:
+        raise RuntimeError(f"No scene sources found under {PROJECT_ROOT} in {', '.join(SOURCE_DIRS)}")
+    return digest.hexdigest()
+
+def scene_key(scene_class: type[Scene], **settings) -> str:
+    """Hash of everything that decides the bytes of a scene's movie.
+
+    Covers the scene's name, the source of every package a scene may draw
+    from (rendering too, since it places labels and picks the level of
+    detail), the output format in Manim's config, the Manim and libav
+    versions, and any render settings passed as keyword arguments (encoder
+    preset, deterministic, ...). Two machines that compute the same key produce
+    interchangeable movies.
+    """
+    inputs = {
+        "scene": f"{scene_class.__module__}.{scene_class.__qualname__}",
+        "sources": _source_digest(),
+        "pixel_width": config.pixel_width,
+        "pixel_height": config.pixel_height,
+        "frame_rate": config.frame_rate,
+        "movie_file_extension": config.movie_file_extension,
+        "transparent": config.transparent,
+        "background_color": str(config.background_color),
+        "manim": manim.__version__,
+        "av": av.__version__,
+        **settings,
+    }
+    return hashlib.sha256(repr(sorted(inputs.items())).encode()).hexdigest()
+
+def movie_path(scene_class: type[Scene], output_file: str | None = None) -> Path:
+    """Where Manim writes the movie of a scene under the current config."""
+    module_name = config.get_dir("input_file").stem if config.input_file else ""
+    movie_dir = config.get_dir("video_dir", module_name=module_name, scene_name=scene_class.__name__)
+    return movie_dir / f"{output_file or scene_class.__name__}{config.movie_file_extension}"
+
+def _temporary(path: Path) -> Path:
+    """A unique name next to ``path`` to write it under before renaming it into place.
+
+    A pid alone isn't unique on a share that processes on several machines write to.
+    """
+    return path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+
+class ArtifactBackend(ABC):
+    """A shared place to keep artifacts, addressed by key.
+
+    Implementations must be safe to call from several threads at once.
+    """
+
+    @abstractmethod
+    def available(self, keys: Iterable[str]) -> set[str]:
+        """Return the subset of ``keys`` present in the store."""
+
+    @abstractmethod
+    def download(self, key: str, path: Path) -> None:
+        """Copy the artifact stored under ``key`` to ``path``."""
+
+    @abstractmethod
+    def upload(self, key: str, path: Path) -> None:
+        """Store the file at ``path`` under ``key``."""
+
+class DirectoryBackend(ArtifactBackend):
+    """Artifacts kept as files in a directory, such as an NFS or SMB share.
+
+    Files are fanned out over subdirectories by the first two characters of
+    their key and written under a temporary name first, so readers on other
+    machines never see a partial upload.
+    """
+
+    def __init__(self, root: Path | str):
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def available(self, keys: Iterable[str]) -> set[str]:
+        return {key for key in keys if self._path(key).exists()}
+
+    def download(self, key: str, path: Path) -> None:
+        shutil.copyfile(self._path(key), path)
+
+    def upload(self, key: str, path: Path) -> None:
+        target = self._path(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _temporary(target)
+        try:
+            shutil.copyfile(path, tmp_path)
+            os.replace(tmp_path, target)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+class S3Backend(ArtifactBackend):
+    """Artifacts kept in an S3-compatible bucket, including MinIO.
+
+    Needs boto3. Credentials and the endpoint come from the usual AWS
+    configuration (``AWS_ACCESS_KEY_ID``, ``AWS_ENDPOINT_URL``, ...) unless
+    given here.
+
+    Args:
+        bucket: Name of the bucket.
+        prefix: Key prefix for every artifact, e.g. "renders/".
+        endpoint_url: URL of the S3 API, e.g. "http://minio.local:9000".
+    """
+
+    def __init__(self, bucket: str, prefix: str = "", endpoint_url: str | None = None):
+        import boto3
+
+        self.bucket = bucket
+        self.prefix = prefix
+        self.client = boto3.client("s3", endpoint_url=endpoint_url)
+
+    def available(self, keys: Iterable[str]) -> set[str]:
+        # One listing answers for every key, instead of one request per key
+        wanted = set(keys)
+        found = set()
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix):
+            for entry in page.get("Contents", []):
+                key = entry["Key"][len(self.prefix):]
+                if key in wanted:
+                    found.add(key)
+        return found
+
+    def download(self, key: str, path: Path) -> None:
+        self.client.download_file(self.bucket, self.prefix + key, str(path))
+
+    def upload(self, key: str, path: Path) -> None:
+        self.client.upload_file(str(path), self.bucket, self.prefix + key)
+
+def open_backend(location: str) -> ArtifactBackend:
+    """Backend for a location: ``s3://bucket/prefix`` or a directory path."""
+    if location.startswith("s3://"):
+        bucket, _, prefix = location[len("s3://"):].partition("/")
+        return S3Backend(bucket, prefix.rstrip("/") + "/" if prefix else "")
+    return DirectoryBackend(location)
+
+class ArtifactStore:
+    """Rendered artifacts shared across machines, with a local copy of each.
+
+    Lookups go to the local directory first and to the backend after that.
+    Downloads for a whole batch of keys run concurrently in prefetch(), and
+    put() only queues an upload; close() runs the queued uploads concurrently.
+    No transfer thread outlives the call that started it, because renders
+    fork worker processes in between and a child forked while another thread
+    holds a lock (in SSL or botocore, say) can deadlock.
+
+    Args:
+        backend: The shared store, or None to only keep artifacts locally.
+        local_dir: Where local copies are kept.
+        workers: Transfers that run at once.
+    """
+
+    def __init__(self, backend: ArtifactBackend | None, local_dir: Path | str = ARTIFACT_DIR,
+                 workers: int = TRANSFER_WORKERS):
+        self.backend = backend
+        self.local_dir = Path(local_dir)
+        self.local_dir.mkdir(parents=True, exist_ok=True)
+        self.workers = workers
+        self.pending: list[str] = []
+
+    def _local(self, key: str) -> Path:
+        return self.local_dir / key
+
+    def _download(self, key: str) -> None:
+        tmp_path = _temporary(self._local(key))
+        try:
+            self.backend.download(key, tmp_path)
+            os.replace(tmp_path, self._local(key))
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def prefetch(self, keys: Iterable[str]) -> set[str]:
+        """Download every key the backend has and the local directory lacks.
+
+        Returns:
+            The keys now available locally.
+        """
+        keys = set(keys)
+        present = {key for key in keys if self._local(key).exists()}
+        if self.backend is None:
+            return present
+        missing = self.backend.available(keys - present)
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="artifacts") as executor:
+            downloads = {key: executor.submit(self._download, key) for key in missing}
+            for key, download in downloads.items():
+                try:
+                    download.result()
+                    present.add(key)
+                except Exception:
+                    # A failed download just means rendering the scene here
+                    pass
+        return present
+
+    def fetch(self, key: str, destination: Path) -> bool:
+        """Copy an artifact to ``destination``; returns False if neither store has it."""
+        if not self._local(key).exists() and key not in self.prefetch([key]):
+            return False
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(self._local(key), destination)
+        return True
+
+    def put(self, key: str, path: Path | str) -> None:
+        """Keep a local copy of an artifact and queue it for upload by close()."""
+        local = self._local(key)
+        tmp_path = _temporary(local)
+        try:
+            shutil.copyfile(path, tmp_path)
+            os.replace(tmp_path, local)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        if self.backend is not None:
+            self.pending.append(key)
+
+    def close(self) -> list[str]:
+        """Run the queued uploads and return the errors of those that failed."""
+        errors = []
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="artifacts") as executor:
+            uploads = [executor.submit(self.backend.upload, key, self._local(key)) for key in self.pending]
+            for upload in uploads:
+                try:
+                    upload.result()
+                except Exception as e:
+                    errors.append(str(e))
+        self.pending.clear()
+        return errors
+
+    def __enter__(self) -> "ArtifactStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+def open_store(location: str | None = None) -> ArtifactStore | None:
+    """Open the artifact store at ``location``, or the one named by UNITY_ARTIFACT_STORE.
+
+    Returns None when neither is set.
+    """
+    location = location or os.environ.get(ARTIFACT_STORE_ENV)
+    if not location:
+        return None
+    return ArtifactStore(open_backend(location))
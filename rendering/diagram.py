@@ -0,0 +1,189 @@
+from pathlib import Path
+from typing import NamedTuple, Sequence
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+from rendering.layout import layout_labels
+from unity.roots import iter_roots_batches, roots_of_unity
+
+# Manim's default palette, so exported diagrams match the rendered scenes
+BACKGROUND = "#000000"
+GRID = "#29ABCA"
+AXES = "#FFFFFF"
+CIRCLE = "#FFFF00"
+POLYGON = "#83C167"
+ROOT = "#FC6255"
+LABEL = "#FFFFFF"
+
+# Label font sizes in pixels, for the base letter and the subscript
+LABEL_FONT_SIZE = 16
+SUBSCRIPT_FONT_SIZE = 11
+
+class DiagramLayout(NamedTuple):
+    """Pixel geometry of one root diagram."""
+    size: int
+    center: float
+    scale: float
+    grid: np.ndarray
+    points: np.ndarray
+    label_points: np.ndarray
+    labels: list[str]
+
+def layout_diagram(n: int, size: int = 480, extent: float = 1.5, labels: bool = True,
+                   roots: np.ndarray | None = None) -> DiagramLayout:
+    """Place the plane, unit circle, roots and labels of the nth roots of unity in pixels.
+
+    Args:
+        n: Which roots of unity to draw.
+        size: Width and height of the image in pixels.
+        extent: The plane shows [-extent, extent] on both axes.
+        labels: Whether to label the roots z_0..z_{n-1}. Labels that would
+            overlap are left out.
+        roots: The roots, if they are already computed.
+    """
+    roots = roots_of_unity(n) if roots is None else roots
+    center = size / 2
+    scale = size / (2 * extent)
+    steps = np.floor(extent / 0.5)
+    grid = center + np.arange(-steps, steps + 1) * 0.5 * scale
+    points = np.stack([center + roots.real * scale, center - roots.imag * scale], axis=1)
+    if labels:
+        # Approximate text boxes: glyphs are about 0.6 em wide
+        digits = np.floor(np.log10(np.maximum(np.arange(n), 1))) + 1
+        widths = 0.6 * (LABEL_FONT_SIZE + SUBSCRIPT_FONT_SIZE * digits)
+        positions, keep = layout_labels(roots, widths, LABEL_FONT_SIZE + 4, radius=scale, offset=8, gap=2)
+        label_points = np.stack([center + positions[keep, 0], center - positions[keep, 1]], axis=1)
+        names = [f"z{k}" for k in np.flatnonzero(keep)]
+    else:
+        label_points = np.empty((0, 2))
+        names = []
+    return DiagramLayout(size, center, scale, grid, points, label_points, names)
+
+def diagram_svg(layout: DiagramLayout, polygon: bool = True) -> str:
+    """Render a diagram layout as an SVG document."""
+    size, center, scale = layout.size, layout.center, layout.scale
+    root_radius = max(1.5, min(6.0, 2 * scale / max(len(layout.points), 1)))
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" viewBox="0 0 {size} {size}">',
+        f'<rect width="{size}" height="{size}" fill="{BACKGROUND}"/>',
+        f'<g stroke="{GRID}" stroke-width="1" stroke-opacity="0.5">',
+    ]
+    parts += [f'<line x1="{v:.2f}" y1="0" x2="{v:.2f}" y2="{size}"/>' for v in layout.grid]
+    parts += [f'<line x1="0" y1="{v:.2f}" x2="{size}" y2="{v:.2f}"/>' for v in layout.grid]
+    parts.append('</g>')
+    parts.append(f'<g stroke="{AXES}" stroke-width="1.5">'
+                 f'<line x1="0" y1="{center:.2f}" x2="{size}" y2="{center:.2f}"/>'
+                 f'<line x1="{center:.2f}" y1="0" x2="{center:.2f}" y2="{size}"/></g>')
+    parts.append(f'<circle cx="{center:.2f}" cy="{center:.2f}" r="{scale:.2f}" '
+                 f'fill="none" stroke="{CIRCLE}" stroke-width="2"/>')
+    if polygon and len(layout.points) > 2:
+        vertices = " ".join(f"{x:.2f},{y:.2f}" for x, y in layout.points)
+        parts.append(f'<polygon points="{vertices}" fill="none" stroke="{POLYGON}" stroke-width="2"/>')
+    parts.append(f'<g fill="{ROOT}">')
+    parts += [f'<circle cx="{x:.2f}" cy="{y:.2f}" r="{root_radius:.2f}"/>' for x, y in layout.points]
+    parts.append('</g>')
+    if layout.labels:
+        parts.append(f'<g fill="{LABEL}" font-family="serif" font-style="italic" font-size="{LABEL_FONT_SIZE}" '
+                     f'text-anchor="middle" dominant-baseline="central">')
+        for (x, y), name in zip(layout.label_points, layout.labels):
+            parts.append(f'<text x="{x:.2f}" y="{y:.2f}">{escape(name[0])}'
+                         f'<tspan font-size="{SUBSCRIPT_FONT_SIZE}" dy="4">{escape(name[1:])}</tspan></text>')
+        parts.append('</g>')
+    parts.append('</svg>')
+    return "\n".join(parts)
+
+def _hex_to_rgb(color: str) -> tuple[float, float, float]:
+    return tuple(int(color[i:i + 2], 16) / 255 for i in (1, 3, 5))
+
+def write_diagram_png(layout: DiagramLayout, path: Path, polygon: bool = True) -> None:
+    """Rasterize a diagram layout to a PNG file with cairo, the library Manim draws with."""
+    import cairo
+
+    size, center, scale = layout.size, layout.center, layout.scale
+    surface = cairo.ImageSurface(cairo.FORMAT_RGB24, size, size)
+    ctx = cairo.Context(surface)
+    ctx.set_source_rgb(*_hex_to_rgb(BACKGROUND))
+    ctx.paint()
+
+    ctx.set_line_width(1)
+    ctx.set_source_rgba(*_hex_to_rgb(GRID), 0.5)
+    for v in layout.grid:
+        ctx.move_to(v, 0)
+        ctx.line_to(v, size)
+        ctx.move_to(0, v)
+        ctx.line_to(size, v)
+    ctx.stroke()
+
+    ctx.set_line_width(1.5)
+    ctx.set_source_rgb(*_hex_to_rgb(AXES))
+    ctx.move_to(0, center)
+    ctx.line_to(size, center)
+    ctx.move_to(center, 0)
+    ctx.line_to(center, size)
+    ctx.stroke()
+
+    ctx.set_line_width(2)
+    ctx.set_source_rgb(*_hex_to_rgb(CIRCLE))
+    ctx.arc(center, center, scale, 0, 2 * np.pi)
+    ctx.stroke()
+
+    if polygon and len(layout.points) > 2:
+        ctx.set_source_rgb(*_hex_to_rgb(POLYGON))
+        ctx.move_to(*layout.points[0])
+        for x, y in layout.points[1:]:
+            ctx.line_to(x, y)
+        ctx.close_path()
+        ctx.stroke()
+
+    root_radius = max(1.5, min(6.0, 2 * scale / max(len(layout.points), 1)))
+    ctx.set_source_rgb(*_hex_to_rgb(ROOT))
+    for x, y in layout.points:
+        ctx.new_sub_path()
+        ctx.arc(x, y, root_radius, 0, 2 * np.pi)
+    ctx.fill()
+
+    if layout.labels:
+        ctx.set_source_rgb(*_hex_to_rgb(LABEL))
+        ctx.select_font_face("serif", cairo.FONT_SLANT_ITALIC, cairo.FONT_WEIGHT_NORMAL)
+        for (x, y), name in zip(layout.label_points, layout.labels):
+            ctx.set_font_size(LABEL_FONT_SIZE)
+            extents = ctx.text_extents(name)
+            ctx.move_to(x - extents.width / 2, y + extents.height / 2)
+            ctx.show_text(name[0])
+            ctx.set_font_size(SUBSCRIPT_FONT_SIZE)
+            ctx.rel_move_to(0, 4)
+            ctx.show_text(name[1:])
+
+    surface.write_to_png(str(path))
+
+def export_diagram(n: int, path: Path | str, size: int = 480, polygon: bool = True,
+                   labels: bool = True, roots: np.ndarray | None = None) -> Path:
+    """Write the diagram of the nth roots of unity to an .svg or .png file.
+
+    Draws the same picture as GeometricPropertiesScene (plane, unit circle,
+    roots, regular polygon and labels) without going through Manim.
+    """
+    path = Path(path)
+    layout = layout_diagram(n, size, labels=labels, roots=roots)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".svg":
+        path.write_text(diagram_svg(layout, polygon))
+    elif path.suffix == ".png":
+        write_diagram_png(layout, path, polygon)
+    else:
+        raise ValueError(f"Unsupported diagram format: {path.suffix}")
+    return path
+
+def export_diagrams(ns: Sequence[int], directory: Path | str, fmt: str = "svg", **options) -> list[Path]:
+    """Write one diagram per n to ``directory/roots_<n>.<fmt>``.
+
+    The roots for all n are computed in batches with iter_roots_batches.
+    """
+    directory = Path(directory)
+    paths = []
+    for batch, roots, offsets in iter_roots_batches(ns):
+        for i, n in enumerate(batch):
+            paths.append(export_diagram(n, directory / f"roots_{n}.{fmt}",
+                                        roots=roots[offsets[i]:offsets[i + 1]], **options))
+    return paths
@@ -0,0 +1,256 @@
+import multiprocessing as mp
+import os
+import queue
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import av
+import numpy as np
+from manim import config, logger
+from manim.scene.scene_file_writer import SceneFileWriter, to_av_frame_rate
+
+# Codec settings for partial movie files, keyed by preset name.
+# Each entry is (codec, pixel format, codec options).
+ENCODER_PRESETS = {
+    # Manim's own settings
+    "default": ("libx264", "yuv420p", {"crf": "23"}),
+    # Every frame is a keyframe and the encoder does almost no analysis, so
+    # encoding keeps up with rasterization at the cost of larger files
+    "preview": ("libx264", "yuv420p", {"preset": "ultrafast", "tune": "zerolatency", "g": "1", "crf": "28"}),
+    # Slower, smaller H.264 for the videos we ship
+    "final": ("libx264", "yuv420p", {"preset": "slow", "crf": "20"}),
+    # HEVC at roughly the same quality as "final" in about half the size
+    "hevc": ("libx265", "yuv420p", {"preset": "medium", "crf": "24", "x265-params": "log-level=error"}),
+}
+
+# x264 splits work by its thread count, which otherwise follows the CPU count,
+# and the split shows up in the output bytes; deterministic encodes pin it
+DETERMINISTIC_THREADS = 4
+
+# Muxer options for deterministic output: no library version tags, no creation time
+DETERMINISTIC_CONTAINER_OPTIONS = {"fflags": "+bitexact"}
+
+def deterministic_options(options: dict[str, str]) -> dict[str, str]:
+    """Codec options that make the same frames always encode to the same bytes."""
+    return {**options, "threads": str(DETERMINISTIC_THREADS), "flags": "+bitexact"}
+
+def strip_metadata(path: Path | str) -> None:
+    """Remux a movie in place without container metadata, using bitexact muxing.
+
+    Drops the comment Manim stamps on every movie along with the muxer's
+    version tag, so the file's bytes depend only on the encoded packets.
+    Packets are copied, not re-encoded.
+    """
+    path = Path(path)
+    stripped = path.with_name(f"{path.stem}_stripped{path.suffix}")
+    with av.open(str(path)) as source, \
+            av.open(str(stripped), mode="w", options=DETERMINISTIC_CONTAINER_OPTIONS) as target:
+        streams = {
+            stream.index: target.add_stream(template=stream)
+            for stream in source.streams
+            if stream.type in ("video", "audio")
+        }
+        for packet in source.demux(*(source.streams[index] for index in streams)):
+            # Skip the flushing packets that demux generates
+            if packet.dts is None:
+                continue
+            packet.stream = streams[packet.stream.index]
+            target.mux(packet)
+    os.replace(stripped, path)
+
+# Seconds between checks that the encoder process is still alive while waiting on it
+ENCODER_POLL_INTERVAL = 1.0
+
+class FrameRing:
+    """A ring of frame-sized slots in shared memory.
+
+    The render process copies each frame into the next free slot and posts the
+    slot index on a queue; the encoder process reads the frame straight out of
+    shared memory, so frames are never pickled or piped between processes.
+
+    Args:
+        shape: Shape of a single frame as (height, width, channels).
+        slots: Number of frames that can be in flight at once.
+    """
+
+    def __init__(self, shape: tuple[int, int, int], slots: int = 8):
+        self.shape = shape
+        self.slots = slots
+        frame_bytes = int(np.prod(shape))
+        self.shm = shared_memory.SharedMemory(create=True, size=frame_bytes * slots)
+        self.frames = np.ndarray((slots, *shape), dtype=np.uint8, buffer=self.shm.buf)
+        self.free = mp.Semaphore(slots)
+        self.commands = mp.Queue()
+        self.next_slot = 0
+        # The process reading the ring; put() gives up once it has exited
+        self.consumer: mp.Process | None = None
+
+    def put(self, message: tuple[int, np.ndarray]) -> None:
+        """Copy a frame into the ring, blocking while every slot is in use.
+
+        Accepts the ``(num_frames, frame)`` messages that SceneFileWriter
+        normally puts on its encoding queue.
+        """
+        num_frames, frame = message
+        while not self.free.acquire(timeout=ENCODER_POLL_INTERVAL):
+            if self.consumer is not None and not self.consumer.is_alive():
+                raise RuntimeError(f"Encoder process exited with code {self.consumer.exitcode}")
+        slot = self.next_slot
+        self.frames[slot] = frame
+        self.next_slot = (slot + 1) % self.slots
+        self.commands.put(("frame", slot, num_frames))
+
+    def close(self) -> None:
+        del self.frames
+        self.shm.close()
+        self.shm.unlink()
+
+def _encode_frames(shm_name: str, shape: tuple[int, int, int], slots: int,
+                   commands: mp.Queue, free, results: mp.Queue) -> None:
+    """Encoder process entry point: encode frames from the ring until told to stop."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    frames = np.ndarray((slots, *shape), dtype=np.uint8, buffer=shm.buf)
+    container = stream = None
+    error = None
+    while True:
+        command = commands.get()
+        if command[0] == "stop":
+            break
+        try:
+            if command[0] == "frame":
+                _, slot, num_frames = command
+                try:
+                    # After a failure, keep draining the ring so the render process never blocks
+                    for _ in range(num_frames if error is None else 0):
+                        av_frame = av.VideoFrame.from_ndarray(frames[slot], format="rgba")
+                        for packet in stream.encode(av_frame):
+                            container.mux(packet)
+                finally:
+                    free.release()
+            elif command[0] == "open" and error is None:
+                _, path, codec, pix_fmt, options, container_options, rate, width, height = command
+                container = av.open(path, mode="w", options=container_options)
+                stream = container.add_stream(codec, rate=rate, options=options)
+                stream.pix_fmt = pix_fmt
+                stream.width = width
+                stream.height = height
+            elif command[0] == "close":
+                if error is not None:
+                    results.put(("error", error))
+                    error = None
+                    continue
+                for packet in stream.encode():
+                    container.mux(packet)
+                container.close()
+                container = stream = None
+                results.put(("closed", None))
+        except Exception as e:
+            container = stream = None
+            if command[0] == "close":
+                results.put(("error", str(e)))
+            else:
+                error = str(e)
+    del frames
+    shm.close()
+
+class OffloadedFileWriter(SceneFileWriter):
+    """A SceneFileWriter that encodes partial movies in a separate process.
+
+    Rasterizing the next frame overlaps with encoding the previous ones instead
+    of competing with them for the render process. Only opaque .mp4 output is
+    offloaded; other formats fall back to Manim's in-process encoder.
+
+    Args:
+        renderer: The renderer the writer belongs to.
+        scene_name: Name of the scene being written.
+        preset: Name of an entry in ENCODER_PRESETS.
+        slots: Number of frames buffered between the two processes.
+        deterministic: Encode with a fixed thread count and bitexact flags, so
+            the same frames always give byte-identical partial movies.
+    """
+
+    def __init__(self, renderer, scene_name, preset: str = "default", slots: int = 8,
+                 deterministic: bool = False, **kwargs):
+        if preset not in ENCODER_PRESETS:
+            raise ValueError(f"Unknown encoder preset {preset!r}, expected one of {list(ENCODER_PRESETS)}")
+        self.preset = preset
+        self.slots = slots
+        self.deterministic = deterministic
+        self.ring = None
+        self.encoder = None
+        self.results = None
+        super().__init__(renderer, scene_name, **kwargs)
+
+    def can_offload(self) -> bool:
+        return config.movie_file_extension == ".mp4" and not config.transparent
+
+    def start_encoder(self) -> None:
+        shape = (config.pixel_height, config.pixel_width, 4)
+        self.ring = FrameRing(shape, self.slots)
+        self.results = mp.Queue()
+        self.encoder = mp.Process(
+            target=_encode_frames,
+            args=(self.ring.shm.name, shape, self.slots, self.ring.commands, self.ring.free, self.results),
+            daemon=True,
+        )
+        self.encoder.start()
+        self.ring.consumer = self.encoder
+
+    def open_partial_movie_stream(self, file_path=None) -> None:
+        if not self.can_offload():
+            return super().open_partial_movie_stream(file_path)
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.partial_movie_file_path = file_path
+        if self.encoder is None:
+            self.start_encoder()
+
+        codec, pix_fmt, options = ENCODER_PRESETS[self.preset]
+        container_options = {}
+        if self.deterministic:
+            options = deterministic_options(options)
+            container_options = DETERMINISTIC_CONTAINER_OPTIONS
+        self.ring.commands.put((
+            "open", str(file_path), codec, pix_fmt, options, container_options,
+            to_av_frame_rate(config.frame_rate), config.pixel_width, config.pixel_height,
+        ))
+        # SceneFileWriter.write_frame hands frames to self.queue
+        self.queue = self.ring
+
+    def close_partial_movie_stream(self) -> None:
+        if not self.can_offload():
+            return super().close_partial_movie_stream()
+        self.ring.commands.put(("close",))
+        while True:
+            try:
+                status, message = self.results.get(timeout=ENCODER_POLL_INTERVAL)
+                break
+            except queue.Empty:
+                if not self.encoder.is_alive():
+                    status, message = "error", f"exited with code {self.encoder.exitcode}"
+                    break
+        if status == "error":
+            self.shutdown()
+            raise RuntimeError(f"Encoder process failed: {message}")
+
+        logger.info(
+            f"Animation {self.renderer.num_plays} : Partial movie file written in %(path)s",
+            {"path": f"'{self.partial_movie_file_path}'"},
+        )
+
+    def finish(self) -> None:
+        self.shutdown()
+        super().finish()
+
+    def shutdown(self) -> None:
+        """Stop the encoder process and release the shared memory. Safe to call twice."""
+        if self.encoder is None:
+            return
+        if self.encoder.is_alive():
+            self.ring.commands.put(("stop",))
+            self.encoder.join(timeout=10)
+            if self.encoder.is_alive():
+                self.encoder.kill()
+                self.encoder.join()
+        self.ring.close()
+        self.encoder = self.ring = self.results = None
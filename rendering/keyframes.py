@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import numpy as np
+from manim import Scene, tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+
+# Keyframes kept per scene, in addition to the final frame
+DEFAULT_KEYFRAMES = 4
+# Where smoke check images are written, one directory per scene
+SMOKE_DIR = Path("media/smoke")
+
+class KeyframeRenderer(CairoRenderer):
+    """A CairoRenderer that fast-forwards every animation and keeps a few keyframes.
+
+    Each play() jumps straight to the end state of its animations, so no
+    intermediate frames are rasterized. The frame after every ``stride``-th
+    play is captured; whenever more than ``max_keyframes`` are held, every
+    other one is dropped and the stride doubles, so the kept keyframes stay
+    evenly spread over a timeline whose length isn't known in advance.
+    """
+
+    def __init__(self, max_keyframes: int = DEFAULT_KEYFRAMES, **kwargs):
+        super().__init__(skip_animations=True, **kwargs)
+        self.max_keyframes = max_keyframes
+        self.stride = 1
+        self.keyframes: list[tuple[int, np.ndarray]] = []
+
+    def play(self, scene, *args, **kwargs):
+        super().play(scene, *args, **kwargs)
+        index = self.num_plays - 1
+        if not self.max_keyframes or index % self.stride:
+            return
+        # Draw every mobject from scratch rather than over the last static image
+        self.static_image = None
+        self.update_frame(scene)
+        self.keyframes.append((index, self.get_frame()))
+        if len(self.keyframes) > self.max_keyframes:
+            self.stride *= 2
+            self.keyframes = [(i, frame) for i, frame in self.keyframes if i % self.stride == 0]
+
+def render_keyframes(scene_class: type[Scene], output_dir: Path | str = SMOKE_DIR,
+                     max_keyframes: int = DEFAULT_KEYFRAMES) -> list[Path]:
+    """Run a scene's construct() without rendering video and save keyframes as PNGs.
+
+    Renders at low quality and writes ``keyframe_<play>.png`` files and
+    ``final.png`` to ``output_dir/<SceneName>``. Any error in construct() or
+    in building mobjects (LaTeX, layout) is raised just as in a full render.
+
+    Returns:
+        Paths of the written images, keyframes first and the final frame last.
+    """
+    directory = Path(output_dir) / scene_class.__name__
+    with tempconfig({
+        "quality": "low_quality",
+        "write_to_movie": False,
+        "save_last_frame": True,
+        "images_dir": str(directory),
+        "output_file": "final",
+    }):
+        renderer = KeyframeRenderer(max_keyframes=max_keyframes)
+        scene = scene_class(renderer=renderer)
+        scene.render()
+
+        paths = []
+        for index, frame in renderer.keyframes:
+            path = directory / f"keyframe_{index:04}.png"
+            renderer.camera.get_image(frame).save(path)
+            paths.append(path)
+        paths.append(Path(renderer.file_writer.image_file_path))
+    return paths
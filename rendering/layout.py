@@ -0,0 +1,130 @@
+from typing import NamedTuple
+
+import numpy as np
+
+def label_positions(roots: np.ndarray, widths: np.ndarray, heights: np.ndarray,
+                    radius: float = 1.0, offset: float = 0.15) -> np.ndarray:
+    """Centers for labels placed just outside each root, pointing away from the origin.
+
+    Each label is pushed out along its root's direction until its box clears
+    the circle of radius ``radius + offset``, like Mobject.next_to with an
+    outward direction.
+
+    Args:
+        roots: Points on the unit circle as complex numbers.
+        widths: Width of each label's box.
+        heights: Height of each label's box.
+        radius: Radius the roots are drawn at.
+        offset: Gap between the circle and the nearest edge of each label.
+
+    Returns:
+        An (n, 2) array of label centers, with y pointing up.
+    """
+    directions = roots / np.maximum(np.abs(roots), np.finfo(float).tiny)
+    # Distance from a box's center to its edge along the direction u
+    half_extent = np.abs(directions.real) * widths / 2 + np.abs(directions.imag) * heights / 2
+    centers = directions * (radius + offset + half_extent)
+    return np.stack([centers.real, centers.imag], axis=1)
+
+def _overlaps(positions: np.ndarray, widths: np.ndarray, heights: np.ndarray,
+              first: np.ndarray, second: np.ndarray, gap: float) -> np.ndarray:
+    dx = np.abs(positions[first, 0] - positions[second, 0])
+    dy = np.abs(positions[first, 1] - positions[second, 1])
+    return ((dx < (widths[first] + widths[second]) / 2 + gap) &
+            (dy < (heights[first] + heights[second]) / 2 + gap))
+
+def thin_labels(positions: np.ndarray, widths: np.ndarray, heights: np.ndarray, gap: float = 0.05) -> np.ndarray:
+    """Choose which labels of a ring to keep so that no two kept labels collide.
+
+    The labels must be in angular order, as for z_0..z_{n-1}. Keeps every
+    s-th label for the smallest stride s at which neighbouring kept labels are
+    ``gap`` apart; each candidate stride is checked with one vectorized pass.
+    Labelling stays regular (z_0, z_s, z_2s, ...) instead of leaving random holes.
+
+    Returns:
+        Boolean mask of the labels to keep.
+    """
+    n = len(positions)
+    keep = np.zeros(n, dtype=bool)
+    if n == 0:
+        return keep
+    # Two kept labels need their centers at least min(w, h) + gap apart, and
+    # centers s roots apart are at most an arc of 2 pi R s / n apart
+    outer = np.hypot(positions[:, 0], positions[:, 1]).max()
+    closest = np.minimum(widths, heights).min() + gap
+    first_stride = max(1, int(n * closest / (2 * np.pi * outer))) if outer > 0 else 1
+    for stride in range(first_stride, n + 1):
+        kept = np.arange(0, n, stride)
+        if len(kept) == 1:
+            break
+        following = np.roll(kept, -1)
+        collisions = _overlaps(positions, widths, heights, kept, following, gap)
+        # The wrap-around pair (last kept, z_0) is closer than the stride when
+        # n isn't a multiple of it; dropping the last label fixes that
+        if collisions[:-1].any():
+            continue
+        if collisions[-1]:
+            kept = kept[:-1]
+            if len(kept) > 1 and _overlaps(positions, widths, heights, kept[-1:], kept[:1], gap)[0]:
+                continue
+        break
+    keep[kept] = True
+    return keep
+
+def layout_labels(roots: np.ndarray, widths: np.ndarray | float, heights: np.ndarray | float,
+                  radius: float = 1.0, offset: float = 0.15, gap: float = 0.05) -> tuple[np.ndarray, np.ndarray]:
+    """Place labels around the roots and cull the ones that would collide.
+
+    Returns:
+        ``(positions, keep)``: label centers for every root and the mask of
+        labels to draw.
+    """
+    n = len(roots)
+    widths = np.broadcast_to(np.asarray(widths, dtype=float), (n,))
+    heights = np.broadcast_to(np.asarray(heights, dtype=float), (n,))
+    positions = label_positions(roots, widths, heights, radius, offset)
+    return positions, thin_labels(positions, widths, heights, gap)
+
+# Below these spacings (in pixels between neighbouring roots) a detail stops being legible
+MIN_LABEL_SPACING = 6.0
+MIN_DOT_SPACING = 3.0
+MIN_EDGE_LENGTH = 2.0
+
+class DetailLevel(NamedTuple):
+    """What a root diagram draws for a given n at a given resolution.
+
+    Attributes:
+        labels: Whether to label roots at all.
+        dots: "full" for one dot per root, "small" for dots shrunk to fit
+            between their neighbours, "arc" for a single stroke along the circle.
+        dot_radius: Dot radius in scene units, for "full" and "small".
+        polygon: "edges" for the regular n-gon, "circle" once its edges are
+            shorter than a couple of pixels and it looks like the circle anyway.
+    """
+    labels: bool
+    dots: str
+    dot_radius: float
+    polygon: str
+
+def choose_detail(n: int, radius: float, pixels_per_unit: float, dot_radius: float = 0.08) -> DetailLevel:
+    """Pick the level of detail for the nth roots drawn on a circle of ``radius`` scene units.
+
+    The amount drawn is bounded by the pixel size of the circle, not by n, so
+    render time stops growing once n exceeds what the output can resolve.
+    """
+    spacing = 2 * np.pi * radius * pixels_per_unit / max(n, 1)
+    dot_pixels = dot_radius * pixels_per_unit
+    if spacing >= 2.5 * dot_pixels:
+        dots, size = "full", dot_radius
+    elif spacing >= MIN_DOT_SPACING:
+        dots, size = "small", spacing / 2.5 / pixels_per_unit
+    else:
+        dots, size = "arc", 0.0
+    # An n-gon edge is 2 R sin(pi/n) long
+    edge = 2 * radius * np.sin(np.pi / max(n, 2)) * pixels_per_unit
+    return DetailLevel(
+        labels=spacing >= MIN_LABEL_SPACING,
+        dots=dots,
+        dot_radius=size,
+        polygon="edges" if edge >= MIN_EDGE_LENGTH else "circle",
+    )
@@ -0,0 +1,203 @@
+import os
+import signal
+import multiprocessing as mp
+from multiprocessing.connection import wait
+from typing import Callable, Iterator
+
+# Headroom kept free for the parent process and the rest of the machine
+MEMORY_RESERVE = 512 * 1024 * 1024
+# Assumed footprint of a render before any worker has reported its peak
+DEFAULT_JOB_ESTIMATE = 768 * 1024 * 1024
+
+def _read_proc(path: str) -> str | None:
+    try:
+        with open(path, 'r') as f:
+            return f.read()
+    except OSError:
+        return None
+
+def available_memory() -> int | None:
+    """Return the memory available for new work in bytes, or None if unknown."""
+    meminfo = _read_proc("/proc/meminfo")
+    if meminfo is None:
+        return None
+    for line in meminfo.splitlines():
+        if line.startswith("MemAvailable:"):
+            return int(line.split()[1]) * 1024
+    return None
+
+def usable_cpus() -> int:
+    """Return the number of CPUs this process may use, busy or not."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+def available_cpus() -> int:
+    """Return the number of CPUs this process may use that are not already busy.
+
+    Returns 0 on a saturated machine.
+    """
+    cpus = usable_cpus()
+    try:
+        load = os.getloadavg()[0]
+    except (AttributeError, OSError):
+        return cpus
+    return max(0, round(cpus - load))
+
+def _descendants(pid: int) -> list[int]:
+    """Return the pids of all processes below ``pid`` in the process tree."""
+    found = []
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            tasks = os.listdir(f"/proc/{current}/task")
+        except OSError:
+            continue
+        for tid in tasks:
+            listing = _read_proc(f"/proc/{current}/task/{tid}/children")
+            if listing:
+                children = [int(child) for child in listing.split()]
+                found.extend(children)
+                pending.extend(children)
+    return found
+
+def process_rss(pid: int) -> int:
+    """Return the resident set size of a process and all of its descendants in bytes.
+
+    Encoder helpers spawned by a render count towards its footprint.
+    Returns 0 when the process has exited or /proc is not available.
+    """
+    total = 0
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    for current in [pid] + _descendants(pid):
+        statm = _read_proc(f"/proc/{current}/statm")
+        if statm is not None:
+            total += int(statm.split()[1]) * page_size
+    return total
+
+def _kill_tree(process: mp.Process) -> None:
+    for pid in _descendants(process.pid):
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except OSError:
+            pass
+    process.kill()
+    process.join()
+
+def _run_job(target: Callable, job, conn) -> None:
+    """Worker process entry point: run one job and send its result back."""
+    try:
+        result = target(job)
+    except BaseException as e:
+        result = (job[0], False, f"✗ Error rendering scene {job[0]}: {str(e)}")
+    conn.send(result)
+    conn.close()
+
+class RenderScheduler:
+    """Run render jobs in separate processes under a memory and CPU budget.
+
+    Every job gets its own process so that its resident memory can be measured
+    and, if it grows beyond ``memory_limit``, the job can be killed without
+    taking the rest of the batch down with it. New jobs are only started while
+    there is a free CPU and enough available memory for the largest footprint
+    observed so far.
+
+    Args:
+        target: Module-level function called in the worker as ``target(job)``.
+            It must return a ``(scene_number, success, message)`` tuple,
+            optionally followed by extra fields such as a stats dict, and
+            ``job[0]`` must be the scene number.
+        max_workers: Upper bound on concurrent jobs. Defaults to the CPU count.
+        memory_limit: Per-job RSS ceiling in bytes. None disables the ceiling.
+        poll_interval: Seconds between memory measurements.
+    """
+
+    def __init__(self, target: Callable, max_workers: int | None = None,
+                 memory_limit: int | None = None, poll_interval: float = 0.5):
+        self.target = target
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.memory_limit = memory_limit
+        self.poll_interval = poll_interval
+        self.peak_rss = 0
+
+    def job_estimate(self) -> int:
+        """Expected RSS of the next job, based on the peaks observed so far."""
+        if self.peak_rss:
+            return int(self.peak_rss * 1.2)
+        return self.memory_limit or DEFAULT_JOB_ESTIMATE
+
+    def can_start(self, running_rss: list[int]) -> bool:
+        """Decide whether one more job fits next to the active jobs.
+
+        Args:
+            running_rss: The current RSS of every active job.
+        """
+        running = len(running_rss)
+        if running == 0:
+            # Always make progress, even on a machine that is already busy
+            return True
+        # The load average lags behind jobs that were just started, so never
+        # plan for more jobs than there are CPUs
+        if running >= min(self.max_workers, usable_cpus(), available_cpus() + running):
+            return False
+        available = available_memory()
+        if available is None:
+            return True
+        # Jobs that were just started haven't allocated yet; count each at the
+        # larger of its estimate and what it uses now
+        estimate = self.job_estimate()
+        outstanding = sum(max(0, estimate - rss) for rss in running_rss)
+        return available - MEMORY_RESERVE - outstanding >= estimate
+
+    def run(self, jobs: list, on_start: Callable | None = None) -> Iterator[tuple]:
+        """Run all jobs and yield their results in order of completion.
+
+        Args:
+            jobs: The jobs to pass to ``target``.
+            on_start: Optional callback, called with each job as its process starts.
+        """
+        pending = list(jobs)
+        running = {}  # connection -> (process, job, peak rss, current rss)
+
+        while pending or running:
+            while pending and self.can_start([entry[3] for entry in running.values()]):
+                job = pending.pop(0)
+                parent_conn, child_conn = mp.Pipe(duplex=False)
+                process = mp.Process(target=_run_job, args=(self.target, job, child_conn))
+                process.start()
+                child_conn.close()
+                if on_start is not None:
+                    on_start(job)
+                running[parent_conn] = (process, job, 0, 0)
+
+            ready = wait(list(running), timeout=self.poll_interval)
+
+            for conn in list(running):
+                process, job, peak, _ = running[conn]
+                if conn in ready:
+                    try:
+                        result = conn.recv()
+                    except EOFError:
+                        process.join()
+                        result = (job[0], False,
+                                  f"✗ Error rendering scene {job[0]}: worker exited with code {process.exitcode}")
+                    process.join()
+                    conn.close()
+                    del running[conn]
+                    self.peak_rss = max(self.peak_rss, peak)
+                    yield result
+                    continue
+
+                rss = process_rss(process.pid)
+                peak = max(peak, rss)
+                running[conn] = (process, job, peak, rss)
+                if self.memory_limit is not None and rss > self.memory_limit:
+                    _kill_tree(process)
+                    conn.close()
+                    del running[conn]
+                    self.peak_rss = max(self.peak_rss, peak)
+                    yield (job[0], False,
+                           f"✗ Error rendering scene {job[0]}: exceeded memory limit of "
+                           f"{self.memory_limit // 2**20} MiB (using {rss // 2**20} MiB)")
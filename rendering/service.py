@@ -0,0 +1,326 @@
+import asyncio
+import itertools
+import json
+import multiprocessing as mp
+import os
+import queue
+import time
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from pathlib import Path
+from typing import AsyncIterator, Callable
+
+from rendering.pool import WarmPool
+from rendering.scheduler import available_cpus
+
+# Where the service listens when no TCP port is given
+SOCKET_PATH = Path(".cache/render.sock")
+# Seconds between "progress" events for a job in progress, or "running" ones
+# while it has nothing new to report
+HEARTBEAT_INTERVAL = 1.0
+# Manim quality presets a render job may ask for
+QUALITIES = ("low_quality", "medium_quality", "high_quality", "production_quality", "fourk_quality")
+
+def _run_render(scene_num: int, quality: str | None, encoder_preset: str | None, keyframes: bool,
+                progress: queue.Queue | None = None) -> str:
+    """Render one catalog scene inside a pool worker and return a description of the output.
+
+    The renderer's counters are put on ``progress`` after every animation.
+    """
+    from manim import tempconfig
+    from main import list_available_scenes, render_manim_scene
+    from rendering.keyframes import render_keyframes
+
+    def report(counters: dict) -> None:
+        try:
+            progress.put(counters)
+        except (OSError, EOFError):
+            # The service went away; the render can still finish
+            pass
+
+    scenes = {num: (name, scene_class) for num, name, scene_class in list_available_scenes()}
+    name, scene_class = scenes[scene_num]
+    if keyframes:
+        return str(render_keyframes(scene_class)[-1])
+    with tempconfig({"quality": quality} if quality else {}):
+        render_manim_scene(scene_class, name, encoder_preset=encoder_preset,
+                           on_progress=report if progress is not None else None)
+    return f"Rendered scene {scene_num}: {name}"
+
+def _run_slides() -> str:
+    from slides.slide_generator import SlideGenerator
+
+    generator = SlideGenerator()
+    return ", ".join(str(path) for path in generator.build_decks())
+
+@lru_cache(maxsize=1)
+def _catalog() -> tuple[frozenset[int], tuple[str, ...]]:
+    """Scene numbers and encoder presets a job may name, loaded on first use."""
+    from main import list_available_scenes
+    from rendering.encoder import ENCODER_PRESETS
+
+    return frozenset(num for num, _, _ in list_available_scenes()), tuple(ENCODER_PRESETS)
+
+def normalize_job(request: dict) -> dict:
+    """Validate a job request and fill in its defaults.
+
+    Two requests that normalize to the same dict are the same job.
+
+    Raises:
+        ValueError: If the request is malformed.
+    """
+    kind = request.get("type")
+    if kind == "slides":
+        return {"type": "slides"}
+    if kind != "render":
+        raise ValueError(f"Unknown job type: {kind!r}")
+    scene = request.get("scene")
+    if not isinstance(scene, int):
+        raise ValueError("A render job needs an integer 'scene' number")
+    scenes, presets = _catalog()
+    if scene not in scenes:
+        raise ValueError(f"Unknown scene {scene}, expected one of {min(scenes)}-{max(scenes)}")
+    quality = request.get("quality")
+    if quality is not None and quality not in QUALITIES:
+        raise ValueError(f"Unknown quality {quality!r}, expected one of {', '.join(QUALITIES)}")
+    encoder_preset = request.get("encoder_preset")
+    if encoder_preset is not None and encoder_preset not in presets:
+        raise ValueError(f"Unknown encoder preset {encoder_preset!r}, expected one of {', '.join(presets)}")
+    return {
+        "type": "render",
+        "scene": scene,
+        "quality": quality,
+        "encoder_preset": encoder_preset,
+        "keyframes": bool(request.get("keyframes", False)),
+    }
+
+def _latest(progress: queue.Queue | None) -> dict | None:
+    """Empty a progress queue and return the newest counters on it, if any."""
+    counters = None
+    while progress is not None:
+        try:
+            counters = progress.get_nowait()
+        except queue.Empty:
+            break
+    return counters
+
+class Job:
+    """A queued or running job and the events it has published so far."""
+
+    def __init__(self, job_id: int, spec: dict):
+        self.id = job_id
+        self.spec = spec
+        self.key = json.dumps(spec, sort_keys=True)
+        self.events: list[dict] = []
+        self.listeners: set[asyncio.Queue] = set()
+        self.done = False
+
+    def publish(self, event: str, **fields) -> None:
+        message = {"job": self.id, "event": event, **fields}
+        if event == "progress":
+            # Clients that join later only need to know how far the job is now
+            self.events = [past for past in self.events if past["event"] != "progress"]
+        if event != "running":
+            # Heartbeats only matter to the clients listening at the time
+            self.events.append(message)
+        for listener in self.listeners:
+            listener.put_nowait(message)
+        if event in ("finished", "failed"):
+            self.done = True
+
+    def subscribe(self) -> asyncio.Queue:
+        """Return a queue that receives the past events of this job, then every future one.
+
+        Of the past events, "running" heartbeats are left out and only the
+        latest "progress" event is kept.
+        """
+        listener = asyncio.Queue()
+        for message in self.events:
+            listener.put_nowait(message)
+        self.listeners.add(listener)
+        return listener
+
+class RenderService:
+    """A local service that queues render and slide jobs for a shared warm worker pool.
+
+    Clients connect over a Unix socket (or localhost TCP if a port is given)
+    and send one JSON object per line, for example
+    ``{"type": "render", "scene": 7, "quality": "low_quality"}`` or
+    ``{"type": "slides"}``. The service replies with a stream of JSON-line
+    events for the job: queued, started, progress (the frames and animations
+    the worker has rendered so far, at most once a second), then finished or
+    failed; a "running" heartbeat with the elapsed time fills the seconds
+    without progress. A request identical to one already queued or running
+    joins that job instead of starting another, and its client receives the
+    same events. ``{"type": "status"}`` returns the jobs in flight.
+
+    Args:
+        max_workers: Number of jobs run at once. Defaults to the idle CPUs.
+        path: Unix socket path to listen on.
+        port: If given, listen on 127.0.0.1:port instead of the Unix socket.
+    """
+
+    def __init__(self, max_workers: int | None = None, path: Path | str = SOCKET_PATH, port: int | None = None):
+        self.max_workers = max_workers or max(1, available_cpus())
+        self.path = Path(path)
+        self.port = port
+        self.pool = WarmPool(max_workers=self.max_workers)
+        # Holds the queues workers report progress on; started by serve_forever()
+        self.manager = None
+        self.queue: asyncio.Queue[Job] = asyncio.Queue()
+        self.in_flight: dict[str, Job] = {}
+        self._ids = itertools.count(1)
+
+    def submit(self, request: dict) -> tuple[Job, bool]:
+        """Queue a job, or join the identical one in flight.
+
+        Returns:
+            The job and whether it was already in flight.
+        """
+        spec = normalize_job(request)
+        key = json.dumps(spec, sort_keys=True)
+        job = self.in_flight.get(key)
+        if job is not None:
+            return job, True
+        job = Job(next(self._ids), spec)
+        self.in_flight[key] = job
+        job.publish("queued", spec=spec, position=self.queue.qsize())
+        self.queue.put_nowait(job)
+        return job, False
+
+    def _call(self, job: Job, progress: queue.Queue | None) -> tuple[Callable, tuple]:
+        spec = job.spec
+        if spec["type"] == "slides":
+            return _run_slides, ()
+        return _run_render, (spec["scene"], spec["quality"], spec["encoder_preset"], spec["keyframes"], progress)
+
+    async def _dispatch(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self.queue.get()
+            start = time.monotonic()
+            job.publish("started")
+            pool = self.pool
+            try:
+                progress = self.manager.Queue() if self.manager is not None else None
+                function, args = self._call(job, progress)
+                task = asyncio.ensure_future(loop.run_in_executor(pool, function, *args))
+                while True:
+                    try:
+                        result = await asyncio.wait_for(asyncio.shield(task), HEARTBEAT_INTERVAL)
+                        break
+                    except asyncio.TimeoutError:
+                        counters = _latest(progress)
+                        elapsed = round(time.monotonic() - start, 1)
+                        if counters is not None:
+                            job.publish("progress", elapsed=elapsed, **counters)
+                        else:
+                            job.publish("running", elapsed=elapsed)
+                job.publish("finished", result=result, elapsed=round(time.monotonic() - start, 1))
+            except BrokenProcessPool:
+                # A worker died (e.g. killed for memory); later jobs get a fresh pool
+                job.publish("failed", error="worker process died", elapsed=round(time.monotonic() - start, 1))
+                # Every job on the broken pool fails; only the first to notice replaces it
+                if self.pool is pool:
+                    self.pool = WarmPool(max_workers=self.max_workers)
+                    pool.shutdown(wait=False)
+                    try:
+                        await loop.run_in_executor(None, self.pool.start)
+                    except BrokenProcessPool:
+                        # The next job to fail on it replaces it again
+                        pass
+            except Exception as e:
+                job.publish("failed", error=str(e), elapsed=round(time.monotonic() - start, 1))
+            finally:
+                self.in_flight.pop(job.key, None)
+                self.queue.task_done()
+
+    async def _send(self, writer: asyncio.StreamWriter, message: dict) -> None:
+        writer.write(json.dumps(message).encode() + b"\n")
+        await writer.drain()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                    if request.get("type") == "status":
+                        await self._send(writer, {"event": "status", "jobs": [
+                            {"job": job.id, "spec": job.spec, "state": job.events[-1]["event"]}
+                            for job in self.in_flight.values()
+                        ]})
+                        continue
+                    job, joined = self.submit(request)
+                except (ValueError, AttributeError) as e:
+                    await self._send(writer, {"event": "rejected", "error": str(e)})
+                    continue
+
+                listener = job.subscribe()
+                try:
+                    if joined:
+                        await self._send(writer, {"job": job.id, "event": "joined"})
+                    while True:
+                        message = await listener.get()
+                        await self._send(writer, message)
+                        if message["event"] in ("finished", "failed"):
+                            break
+                finally:
+                    job.listeners.discard(listener)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve_forever(self) -> None:
+        self.manager = mp.get_context("forkserver").Manager()
+        # Pay for worker startup before accepting jobs rather than on the first ones
+        await asyncio.get_running_loop().run_in_executor(None, self.pool.start)
+        dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.max_workers)]
+        if self.port is not None:
+            server = await asyncio.start_server(self._handle, "127.0.0.1", self.port)
+            print(f"Render service listening on 127.0.0.1:{self.port}")
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.unlink(missing_ok=True)
+            server = await asyncio.start_unix_server(self._handle, path=str(self.path))
+            os.chmod(self.path, 0o600)
+            print(f"Render service listening on {self.path}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for dispatcher in dispatchers:
+                dispatcher.cancel()
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.manager.shutdown()
+            if self.port is None:
+                self.path.unlink(missing_ok=True)
+
+async def request_job(request: dict, path: Path | str = SOCKET_PATH, port: int | None = None) -> AsyncIterator[dict]:
+    """Send one job to a running service and yield its events until it finishes."""
+    if port is not None:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    else:
+        reader, writer = await asyncio.open_unix_connection(str(path))
+    try:
+        writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+        while line := await reader.readline():
+            message = json.loads(line)
+            yield message
+            if message["event"] in ("finished", "failed", "rejected", "status"):
+                break
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+def run_job(request: dict, path: Path | str = SOCKET_PATH, port: int | None = None,
+            on_event: Callable[[dict], None] = print) -> dict:
+    """Blocking client: send a job, pass every event to ``on_event`` and return the last one."""
+    async def collect():
+        last = None
+        async for message in request_job(request, path, port):
+            on_event(message)
+            last = message
+        return last
+    return asyncio.run(collect())
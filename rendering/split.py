@@ -0,0 +1,154 @@
+import os
+from functools import partial
+from pathlib import Path
+
+import av
+from manim import Scene, config, tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from rendering.encoder import OffloadedFileWriter
+from rendering.scheduler import RenderScheduler
+
+class TimelineRenderer(CairoRenderer):
+    """A CairoRenderer that records the duration of every play() and wait() call."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.durations = []
+
+    def play(self, scene, *args, **kwargs):
+        start = self.time
+        super().play(scene, *args, **kwargs)
+        self.durations.append(self.time - start)
+
+def measure_timeline(scene_class: type[Scene]) -> list[float]:
+    """Run a scene's construct() without rasterizing and return the duration of each animation."""
+    with tempconfig({"dry_run": True}):
+        renderer = TimelineRenderer(skip_animations=True)
+        scene = scene_class(renderer=renderer)
+        scene.render()
+    return renderer.durations
+
+def split_timeline(durations: list[float], ranges: int) -> list[tuple[int, int]]:
+    """Split a timeline into contiguous animation ranges of roughly equal duration.
+
+    Args:
+        durations: Duration of each animation, in play order.
+        ranges: Desired number of ranges.
+
+    Returns:
+        List of inclusive (first, last) animation indices, in order.
+    """
+    ranges = max(1, min(ranges, len(durations)))
+    total = sum(durations)
+    bounds = []
+    start = 0
+    elapsed = 0.0
+    for i, duration in enumerate(durations):
+        elapsed += duration
+        remaining_ranges = ranges - len(bounds) - 1
+        remaining_animations = len(durations) - i - 1
+        if remaining_ranges == 0:
+            break
+        # Close the range once it reaches its share of the total, while leaving
+        # at least one animation for each of the ranges still to come
+        if elapsed >= total * (len(bounds) + 1) / ranges or remaining_animations == remaining_ranges:
+            bounds.append((start, i))
+            start = i + 1
+    bounds.append((start, len(durations) - 1))
+    return bounds
+
+def _render_range(job: tuple[int, type[Scene], int, int, str, str | None, bool]) -> tuple[int, bool, str]:
+    """Render one animation range of a scene. On success, the message is the movie's path."""
+    index, scene_class, first, last, output_file, encoder_preset, deterministic = job
+    overrides = {
+        "from_animation_number": first,
+        "upto_animation_number": last,
+        "output_file": output_file,
+        # Each range keeps its partial movie files to itself, and deterministic
+        # encodes never reuse partial movies encoded with other settings
+        "partial_movie_dir": os.path.join(config.partial_movie_dir, "deterministic" if deterministic else "",
+                                          f"range_{index}"),
+    }
+    try:
+        with tempconfig(overrides):
+            if encoder_preset is None:
+                scene = scene_class()
+                scene.render()
+            else:
+                renderer = CairoRenderer(file_writer_class=partial(
+                    OffloadedFileWriter, preset=encoder_preset, deterministic=deterministic,
+                ))
+                scene = scene_class(renderer=renderer)
+                try:
+                    scene.render()
+                finally:
+                    scene.renderer.file_writer.shutdown()
+            return index, True, str(scene.renderer.file_writer.movie_file_path)
+    except Exception as e:
+        return index, False, f"✗ Error rendering animations {first}-{last}: {str(e)}"
+
+def stitch_movies(input_files: list[str], output_file: Path) -> None:
+    """Concatenate movies with identical stream settings without re-encoding them."""
+    file_list = output_file.with_suffix(".txt")
+    with open(file_list, 'w', encoding='utf-8') as f:
+        for path in input_files:
+            f.write(f"file 'file:{Path(path).as_posix()}'\n")
+
+    movies_input = av.open(str(file_list), options={"safe": "0", "an": "1"}, format="concat")
+    input_stream = movies_input.streams.video[0]
+    output_container = av.open(str(output_file), mode="w")
+    output_stream = output_container.add_stream(template=input_stream)
+    for packet in movies_input.demux(input_stream):
+        # Skip the flushing packets that demux generates
+        if packet.dts is None:
+            continue
+        # Timestamps restart in every file, so let libav recompute them
+        packet.dts = None
+        packet.stream = output_stream
+        output_container.mux(packet)
+    movies_input.close()
+    output_container.close()
+    file_list.unlink()
+
+def render_scene_split(scene_class: type[Scene], output_file: str | None = None, ranges: int | None = None,
+                       max_workers: int | None = None, encoder_preset: str | None = None,
+                       deterministic: bool = False) -> Path:
+    """Render a single scene on several cores by splitting its timeline.
+
+    The scene is first run without rasterizing to measure its animations. The
+    timeline is then cut into contiguous ranges of similar duration; every range
+    is rendered in its own process, which fast-forwards through the animations
+    before its range, and the resulting movies are stitched together.
+
+    Args:
+        scene_class: The Manim scene class to render
+        output_file: Name of the final movie without extension. If None, uses the class name.
+        ranges: Number of ranges to split the timeline into. If None, uses the CPU count.
+        max_workers: Maximum number of ranges rendered at once.
+        encoder_preset: Optional encoder preset used by every range, see render_manim_scene.
+        deterministic: Encode every range with fixed encoder settings, see OffloadedFileWriter.
+            Requires an encoder preset.
+
+    Returns:
+        Path of the stitched movie.
+    """
+    output_file = output_file or scene_class.__name__
+    bounds = split_timeline(measure_timeline(scene_class), ranges or os.cpu_count() or 1)
+    jobs = [
+        (i, scene_class, first, last, f"{output_file}_range{i}", encoder_preset, deterministic)
+        for i, (first, last) in enumerate(bounds)
+    ]
+
+    movies = {}
+    for index, success, message in RenderScheduler(_render_range, max_workers=max_workers).run(jobs):
+        if not success:
+            raise RuntimeError(message)
+        movies[index] = message
+
+    parts = [movies[i] for i in range(len(jobs))]
+    movie_file = Path(parts[0]).with_name(f"{output_file}{config.movie_file_extension}")
+    stitch_movies(parts, movie_file)
+    for part in parts:
+        os.remove(part)
+    return movie_file
@@ -0,0 +1,148 @@
+import json
+import time
+from pathlib import Path
+from typing import Callable, TextIO
+
+from manim.renderer.cairo_renderer import CairoRenderer
+
+# Where render batches append their events
+TELEMETRY_PATH = Path("media/render_telemetry.jsonl")
+
+class TelemetryRenderer(CairoRenderer):
+    """A CairoRenderer that counts the frames it writes and the animations it reuses from cache.
+
+    Args:
+        on_progress: Optional callback, called after every animation with the
+            counters so far (frames, animations and cache hits).
+    """
+
+    def __init__(self, *args, on_progress: Callable[[dict], None] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.frames = 0
+        self.cache_hits = 0
+        self.on_progress = on_progress
+
+    def play(self, scene, *args, **kwargs):
+        super().play(scene, *args, **kwargs)
+        # A hashed animation that ended up skipped was served from the partial movie cache
+        if self.animations_hashes[-1] is not None and self.skip_animations:
+            self.cache_hits += 1
+        if self.on_progress is not None:
+            self.on_progress({"frames": self.frames, "animations": self.num_plays, "cache_hits": self.cache_hits})
+
+    def add_frame(self, frame, num_frames: int = 1):
+        if not self.skip_animations:
+            self.frames += num_frames
+        super().add_frame(frame, num_frames)
+
+    def stats(self) -> dict:
+        """Counters for the finished scene, including the size of the file it wrote."""
+        output = None
+        if hasattr(self, "file_writer"):
+            output = getattr(self.file_writer, "movie_file_path", None) or getattr(self.file_writer, "image_file_path", None)
+        size = Path(output).stat().st_size if output and Path(output).exists() else 0
+        return {
+            "frames": self.frames,
+            "animations": self.num_plays,
+            "cache_hits": self.cache_hits,
+            "bytes": size,
+            "path": str(output) if output else None,
+        }
+
+class TelemetryLog:
+    """Append-only JSON-lines event log.
+
+    Every event is one line with an ``event`` name, a unix ``time`` and any
+    extra fields, flushed immediately so that the log can be tailed live.
+
+    Args:
+        path: File to append to. None disables the file.
+        stream: Optional second destination such as sys.stderr.
+    """
+
+    def __init__(self, path: Path | str | None = TELEMETRY_PATH, stream: TextIO | None = None):
+        self.file = None
+        if path is not None:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self.file = open(path, 'a', encoding='utf-8')
+        self.stream = stream
+
+    def emit(self, event: str, **fields) -> dict:
+        record = {"event": event, "time": round(time.time(), 3), **fields}
+        line = json.dumps(record, ensure_ascii=False)
+        for destination in (self.file, self.stream):
+            if destination is not None:
+                destination.write(line + "\n")
+                destination.flush()
+        return record
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def __enter__(self) -> "TelemetryLog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+class BatchProgress:
+    """Running totals for a batch of scene renders, with throughput and ETA.
+
+    Args:
+        total: Number of scenes in the batch.
+    """
+
+    def __init__(self, total: int):
+        self.total = total
+        self.started_at = time.monotonic()
+        self.running: dict[int, float] = {}
+        self.completed = 0
+        self.failed = 0
+        self.frames = 0
+        self.bytes = 0
+        self.cache_hits = 0
+
+    def start(self, num: int) -> None:
+        self.running[num] = time.monotonic()
+
+    def finish(self, num: int, success: bool, stats: dict | None = None) -> float:
+        """Record a finished scene, successful or not; returns its wall time in seconds."""
+        started = self.running.pop(num, self.started_at)
+        self.completed += 1
+        if not success:
+            self.failed += 1
+        stats = stats or {}
+        self.frames += stats.get("frames", 0)
+        self.bytes += stats.get("bytes", 0)
+        self.cache_hits += stats.get("cache_hits", 0)
+        return time.monotonic() - started
+
+    def snapshot(self) -> dict:
+        """Aggregate view of the batch so far."""
+        elapsed = time.monotonic() - self.started_at
+        remaining = self.total - self.completed
+        eta = elapsed / self.completed * remaining if self.completed else None
+        return {
+            "completed": self.completed,
+            "failed": self.failed,
+            "total": self.total,
+            "running": len(self.running),
+            "elapsed": round(elapsed, 1),
+            "frames": self.frames,
+            "fps": round(self.frames / elapsed, 1) if elapsed else 0.0,
+            "scenes_per_minute": round(60 * self.completed / elapsed, 2) if elapsed else 0.0,
+            "bytes": self.bytes,
+            "cache_hits": self.cache_hits,
+            "eta": round(eta, 1) if eta is not None else None,
+        }
+
+    def describe(self) -> str:
+        """One-line human readable summary of snapshot()."""
+        view = self.snapshot()
+        eta = f"{view['eta']:.0f}s" if view["eta"] is not None else "unknown"
+        return (f"Progress: {view['completed']}/{view['total']} scenes "
+                f"({view['failed']} failed), {view['fps']} frames/s, "
+                f"{view['scenes_per_minute']} scenes/min, ETA {eta}")
@@ -0,0 +1,153 @@
+import gzip
+import hashlib
+import os
+import re
+from pathlib import Path
+
+# Precompressed siblings are only kept when they save at least this fraction
+MIN_COMPRESSION_SAVING = 0.1
+# Hex digits of the content hash in asset file names
+HASH_LENGTH = 10
+
+# Elements whose text must keep its whitespace exactly
+PRESERVED = re.compile(r"(<(pre|textarea|script)\b.*?</\2\s*>)", re.IGNORECASE | re.DOTALL)
+# Whitespace next to these tags never renders, so it can go
+BLOCK_TAGS = ("html|head|body|meta|link|title|style|script|div|section|header|footer|nav|main|article|"
+              "p|h[1-6]|ul|ol|li|dl|dt|dd|pre|blockquote|table|thead|tbody|tr|th|td|hr|br")
+AROUND_BLOCK_TAG = re.compile(rf"\s*(</?(?:{BLOCK_TAGS})\b[^>]*>)\s*", re.IGNORECASE)
+HTML_COMMENT = re.compile(r"<!--(?!\[if).*?-->", re.DOTALL)
+INLINE_STYLE = re.compile(r"<style>(.*?)</style>", re.DOTALL)
+
+CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+CSS_PUNCTUATION = re.compile(r"\s*([{}:;,>])\s*")
+
+def minify_css(css: str) -> str:
+    """Drop comments and every space CSS syntax doesn't need."""
+    css = CSS_COMMENT.sub("", css)
+    css = re.sub(r"\s+", " ", css)
+    css = CSS_PUNCTUATION.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+def _minify_text(html: str) -> str:
+    html = HTML_COMMENT.sub("", html)
+    html = re.sub(r"\s+", " ", html)
+    return AROUND_BLOCK_TAG.sub(r"\1", html)
+
+def minify_html(html: str) -> str:
+    """Collapse whitespace and drop comments, leaving pre, textarea and script contents untouched.
+
+    Whitespace between inline elements shrinks to a single space instead of
+    disappearing, so the rendered text is unchanged.
+    """
+    parts = PRESERVED.split(html)
+    # split() returns text, whole match, tag name, text, ...
+    chunks = []
+    for i in range(0, len(parts), 3):
+        text = _minify_text(parts[i])
+        # pre and script are block-level too, textarea is not
+        if i > 0 and parts[i - 1].lower() != "textarea":
+            text = text.lstrip()
+        if i + 2 < len(parts) and parts[i + 2].lower() != "textarea":
+            text = text.rstrip()
+        chunks.append(text)
+        if i + 1 < len(parts):
+            chunks.append(parts[i + 1])
+    return "".join(chunks).strip()
+
+def _hashed_versions(directory: Path, stem: str, suffix: str) -> list[Path]:
+    """Every ``stem.<hash>suffix`` asset in a directory, with its compressed siblings."""
+    versions = re.compile(rf"{re.escape(stem)}\.[0-9a-f]{{{HASH_LENGTH}}}{re.escape(suffix)}(\.gz|\.br)?")
+    return [path for path in directory.iterdir() if versions.fullmatch(path.name)]
+
+def write_hashed(directory: Path, stem: str, suffix: str, data: bytes) -> str:
+    """Write an asset as ``stem.<hash>suffix`` and delete older versions of it.
+
+    The name changes whenever the content does, so servers can let browsers
+    cache assets indefinitely.
+
+    Returns:
+        The file name of the asset.
+    """
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    name = f"{stem}.{digest}{suffix}"
+    # Older versions, with their compressed siblings
+    for stale in _hashed_versions(directory, stem, suffix):
+        if not stale.name.startswith(name):
+            stale.unlink()
+    path = directory / name
+    if not path.exists():
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    return name
+
+def write_compressed(path: Path) -> list[Path]:
+    """Write gzip and, if the brotli package is installed, brotli siblings of a file.
+
+    Web servers with precompressed file support (nginx gzip_static and
+    brotli_static, Caddy's precompressed) send them as they are instead of
+    compressing on every request. Compression is at the highest level, since
+    it happens once per build. Siblings that wouldn't save much are removed.
+
+    Returns:
+        The siblings written.
+    """
+    data = path.read_bytes()
+    # mtime=0 keeps the gzip header identical between builds
+    encoded = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    try:
+        import brotli
+    except ImportError:
+        # A .br from a build that had brotli would now be stale
+        path.with_name(path.name + ".br").unlink(missing_ok=True)
+    else:
+        encoded[".br"] = brotli.compress(data, quality=11)
+
+    written = []
+    for suffix, compressed in encoded.items():
+        sibling = path.with_name(path.name + suffix)
+        if len(compressed) <= len(data) * (1 - MIN_COMPRESSION_SAVING):
+            sibling.write_bytes(compressed)
+            written.append(sibling)
+        else:
+            sibling.unlink(missing_ok=True)
+    return written
+
+def optimize_deck(output_file: Path) -> list[Path]:
+    """Post-process a written deck for serving.
+
+    Moves the inline stylesheet into a content-hashed .css file next to the
+    deck, minifies the HTML and CSS, and writes precompressed siblings of
+    both. The deck itself keeps its name, since it is the page people open.
+
+    Returns:
+        Every file the deck now consists of.
+    """
+    html = output_file.read_text(encoding='utf-8')
+    styles = INLINE_STYLE.findall(html)
+    files = [output_file]
+    if styles:
+        css = minify_css("".join(styles)).encode()
+        name = write_hashed(output_file.parent, output_file.stem, ".css", css)
+        html = INLINE_STYLE.sub("", html)
+        html = html.replace("</head>", f'<link rel="stylesheet" href="{name}" /></head>', 1)
+        files.append(output_file.parent / name)
+
+    tmp_file = output_file.with_suffix(f".{os.getpid()}.tmp")
+    tmp_file.write_text(minify_html(html), encoding='utf-8')
+    os.replace(tmp_file, output_file)
+
+    for path in list(files):
+        files.extend(write_compressed(path))
+    return files
+
+def clean_deck(output_file: Path) -> None:
+    """Remove what optimize_deck() left next to a deck, for an unoptimized rebuild.
+
+    Servers prefer precompressed siblings, so ones from an earlier optimized
+    build would keep serving the old deck.
+    """
+    for suffix in (".gz", ".br"):
+        output_file.with_name(output_file.name + suffix).unlink(missing_ok=True)
+    for asset in _hashed_versions(output_file.parent, output_file.stem, ".css"):
+        asset.unlink()
@@ -1,41 +1,232 @@
+import hashlib
 import markdown
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
+from typing import Iterable, Iterator, NamedTuple
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from slides.assets import clean_deck, optimize_deck
+
+# Compiled templates, kept between runs
+TEMPLATE_CACHE_DIR = Path(".cache/jinja")
+# Layout used by slides that don't name one
+DEFAULT_LAYOUT = "default"
+# A slide picks its layout with this comment on its first line
+LAYOUT_DIRECTIVE = re.compile(r"\A\s*<!--\s*layout:\s*([\w-]+)\s*-->\s*\n?")
+# Lines that separate slides, and vertical sub-slides within one, as in reveal.js
+SLIDE_SEPARATOR = "---"
+VERTICAL_SEPARATOR = "--"
+# Opening and closing lines of fenced code blocks, where separators don't count
+CODE_FENCE = re.compile(r"^\s*(```|~~~)")
+# Optional list of a deck's files, one path per line relative to the deck
+DECK_MANIFEST = "deck.txt"
+MARKDOWN_EXTENSIONS = ['extra', 'codehilite']
+
+class Slide(NamedTuple):
+    """One converted slide and the layout template it is rendered with."""
+    layout: str
+    html: str
+
+# A horizontal slide and the vertical sub-slides below it
+Stack = list[Slide]
+
+@lru_cache(maxsize=None)
+def template_environment(template_dir: str) -> Environment:
+    """The Jinja environment for a template directory, shared by every generator in the process.
+
+    Compiled templates go to a bytecode cache on disk, so later runs skip
+    parsing and compiling them; Jinja still checks the sources' modification
+    times and recompiles what changed.
+    """
+    TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        bytecode_cache=FileSystemBytecodeCache(str(TEMPLATE_CACHE_DIR)),
+    )
+
+@lru_cache(maxsize=None)
+def _markdown() -> markdown.Markdown:
+    # Loading the extensions costs more than converting a typical slide
+    return markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+
+def split_slides(content: str) -> list[list[str]]:
+    """Split markdown on separator lines into stacks of vertical slides.
+
+    A line holding only ``---`` starts a new slide and a line holding only
+    ``--`` starts a sub-slide below the current one. Separators inside fenced
+    code blocks are left alone.
+    """
+    stacks = [[[]]]
+    fenced = False
+    for line in content.splitlines(keepends=True):
+        if CODE_FENCE.match(line):
+            fenced = not fenced
+        elif not fenced and line.strip() == SLIDE_SEPARATOR:
+            stacks.append([[]])
+            continue
+        elif not fenced and line.strip() == VERTICAL_SEPARATOR:
+            stacks[-1].append([])
+            continue
+        stacks[-1][-1].append(line)
+    return [["".join(lines) for lines in stack] for stack in stacks]
+
+def convert_slide(source: str) -> Slide:
+    """Convert one slide's markdown, honouring a ``<!-- layout: name -->`` first line."""
+    layout = DEFAULT_LAYOUT
+    directive = LAYOUT_DIRECTIVE.match(source)
+    if directive:
+        layout = directive.group(1)
+        source = source[directive.end():]
+    converter = _markdown()
+    html = converter.convert(source)
+    converter.reset()
+    return Slide(layout, html)
+
+def convert_file(content: str) -> list[Stack]:
+    """Convert a markdown file to its stacks of slides."""
+    return [[convert_slide(source) for source in stack] for stack in split_slides(content)]
+
+def _write_deck(template_dir: str, output_file: Path, stacks: Iterable[Stack], optimize: bool = False) -> Path:
+    """Stream a deck to ``output_file`` through presentation.html, optionally optimizing it for serving."""
+    template = template_environment(template_dir).get_template("presentation.html")
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    # Write under a temporary name so a failed build never leaves half a deck behind
+    tmp_file = output_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            for chunk in template.generate(slides=stacks):
+                f.write(chunk)
+        os.replace(tmp_file, output_file)
+    finally:
+        tmp_file.unlink(missing_ok=True)
+    if optimize:
+        optimize_deck(output_file)
+    else:
+        clean_deck(output_file)
+    return output_file
 
 class SlideGenerator:
-    def __init__(self, slides_dir="slides/content", template_dir="slides/templates", output_dir="slides/output"):
+    def __init__(self, slides_dir="slides/content", template_dir="slides/templates", output_dir="slides/output",
+                 optimize=True):
         self.slides_dir = Path(slides_dir)
         self.template_dir = Path(template_dir)
         self.output_dir = Path(output_dir)
-        self.env = Environment(loader=FileSystemLoader(str(self.template_dir)))
-        
+        # Minify, hash and precompress decks for serving (see slides.assets.optimize_deck)
+        self.optimize = optimize
+        self.env = template_environment(str(self.template_dir))
+
         # Create necessary directories
         for directory in [self.slides_dir, self.template_dir, self.output_dir]:
             directory.mkdir(exist_ok=True, parents=True)
-    
-    def generate_slides(self):
-        """Generate HTML slides from markdown files."""
-        template = self.env.get_template("presentation.html")
-        slides_content = []
-        
-        # Read all markdown files in order
-        for md_file in sorted(self.slides_dir.glob("*.md")):
+
+    def layouts(self) -> list[str]:
+        """Names of the layout templates in templates/layouts."""
+        return sorted(path.stem for path in (self.template_dir / "layouts").glob("*.html"))
+
+    def precompile_templates(self) -> None:
+        """Compile every template into the bytecode cache ahead of the first build."""
+        for name in self.env.list_templates(extensions=["html"]):
+            self.env.get_template(name)
+
+    def check_layouts(self, stacks: list[Stack], source: Path) -> list[Stack]:
+        layouts = self.layouts()
+        for stack in stacks:
+            for slide in stack:
+                if slide.layout not in layouts:
+                    raise ValueError(f"Unknown slide layout {slide.layout!r} in {source}, expected one of {layouts}")
+        return stacks
+
+    def deck_files(self, deck_dir: Path) -> list[Path]:
+        """The markdown files of a deck, in order.
+
+        Listed in the deck's deck.txt if it has one, which may name files
+        outside the deck such as slides shared between decks; otherwise every
+        .md file in the directory, sorted by name.
+        """
+        manifest = deck_dir / DECK_MANIFEST
+        if not manifest.exists():
+            return sorted(deck_dir.glob("*.md"))
+        with open(manifest, 'r', encoding='utf-8') as f:
+            lines = [line.strip() for line in f]
+        return [deck_dir / line for line in lines if line and not line.startswith("#")]
+
+    def find_decks(self) -> dict[Path, list[Path]]:
+        """Every deck under the content directory, keyed by its path relative to it.
+
+        A deck is a directory with .md files or a deck.txt. Directories whose
+        name starts with an underscore, such as _shared, hold slides for other
+        decks to include and are not decks themselves.
+        """
+        decks = {}
+        for directory in [self.slides_dir, *sorted(p for p in self.slides_dir.rglob("*") if p.is_dir())]:
+            relative = directory.relative_to(self.slides_dir)
+            if any(part.startswith("_") for part in relative.parts):
+                continue
+            files = self.deck_files(directory)
+            if files:
+                decks[relative] = files
+        return decks
+
+    def read_slides(self, files: Iterable[Path] | None = None) -> Iterator[Stack]:
+        """Convert markdown files to stacks of slides, one file at a time."""
+        for md_file in files if files is not None else self.deck_files(self.slides_dir):
             with open(md_file, 'r', encoding='utf-8') as f:
                 content = f.read()
-                html = markdown.markdown(content, extensions=['extra', 'codehilite'])
-                slides_content.append(html)
-        
-        # Generate the presentation
-        presentation = template.render(slides=slides_content)
-        
-        # Write the output
-        output_file = self.output_dir / "presentation.html"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(presentation)
-        
+            yield from self.check_layouts(convert_file(content), md_file)
+
+    def generate_slides(self):
+        """Generate HTML slides from markdown files.
+
+        The presentation is streamed to disk as the template renders, and each
+        markdown file is converted only when the template reaches it, so the
+        whole deck is never held in memory at once.
+        """
+        output_file = _write_deck(str(self.template_dir), self.output_dir / "presentation.html",
+                                  self.read_slides(), self.optimize)
         print(f"Presentation generated at {output_file}")
 
+    def build_decks(self, max_workers: int | None = None) -> list[Path]:
+        """Build every deck found by find_decks() in parallel processes.
+
+        Each distinct file is converted once, however many decks include it
+        (files are matched by content, so copies count as the same file), and
+        the converted fragments are handed to every deck that uses them. Deck
+        ``a/b`` is written to ``<output_dir>/a/b/presentation.html``.
+
+        Returns:
+            The paths of the written decks.
+        """
+        decks = self.find_decks()
+        sources = {}
+        for files in decks.values():
+            for md_file in files:
+                if md_file not in sources:
+                    sources[md_file] = md_file.read_text(encoding='utf-8')
+        digests = {md_file: hashlib.sha256(content.encode()).hexdigest() for md_file, content in sources.items()}
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            conversions = {}
+            for md_file, content in sources.items():
+                if digests[md_file] not in conversions:
+                    conversions[digests[md_file]] = executor.submit(convert_file, content)
+            fragments = {md_file: self.check_layouts(conversions[digest].result(), md_file)
+                         for md_file, digest in digests.items()}
+
+            writes = [
+                executor.submit(
+                    _write_deck, str(self.template_dir), self.output_dir / deck / "presentation.html",
+                    [stack for md_file in files for stack in fragments[md_file]], self.optimize,
+                )
+                for deck, files in decks.items()
+            ]
+            outputs = [write.result() for write in writes]
+
+        for output_file in outputs:
+            print(f"Presentation generated at {output_file}")
+        return outputs
+
 if __name__ == "__main__":
     generator = SlideGenerator()
-    generator.generate_slides() 
\ No newline at end of file
+    generator.build_decks()
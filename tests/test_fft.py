@@ -0,0 +1,39 @@
+import time
+
+import numpy as np
+
+from unity.fft import dft
+
+# A product of two primes above MAX_DIRECT_RADIX, where a dense butterfly costs O(n p)
+LARGE_PRIMES = (4099, 4111)
+# How much slower than NumPy's pocketfft dft() may be on it
+MAX_SLOWDOWN = 10
+
+def _reference(x: np.ndarray) -> np.ndarray:
+    # dft() uses e^{+2 pi i jk/n}, NumPy's fft e^{-2 pi i jk/n}
+    return np.fft.fft(x.conj()).conj()
+
+def test_matches_numpy():
+    rng = np.random.default_rng(0)
+    for n in (1, 2, 6, 16, 48, 97, 64 * 67, 2 * 1031, 3 * 5 * 7 * 1031):
+        x = rng.standard_normal(n) + 1j * rng.standard_normal(n)
+        np.testing.assert_allclose(dft(x), _reference(x), rtol=0, atol=1e-9 * n)
+
+def test_batched_rows():
+    x = np.random.default_rng(1).standard_normal((3, 4, 2 * 1031))
+    np.testing.assert_allclose(dft(x), _reference(x), rtol=0, atol=1e-9 * x.shape[-1])
+
+def test_product_of_large_primes_is_fast():
+    n = LARGE_PRIMES[0] * LARGE_PRIMES[1]
+    x = np.random.default_rng(2).standard_normal(n) + 0j
+
+    start = time.perf_counter()
+    expected = _reference(x)
+    numpy_time = time.perf_counter() - start
+    start = time.perf_counter()
+    result = dft(x)
+    dft_time = time.perf_counter() - start
+
+    np.testing.assert_allclose(result, expected, rtol=0, atol=1e-9 * n)
+    assert dft_time < MAX_SLOWDOWN * max(numpy_time, 0.01), (
+        f"dft took {dft_time:.2f}s for n = {n}, NumPy {numpy_time:.2f}s")
@@ -0,0 +1,75 @@
+from itertools import combinations
+from math import prod
+
+import numpy as np
+
+def prime_factors(n: int) -> list[int]:
+    """Return the distinct prime factors of n in increasing order."""
+    factors = []
+    factor = 2
+    while factor * factor <= n:
+        if n % factor == 0:
+            factors.append(factor)
+            while n % factor == 0:
+                n //= factor
+        factor += 1 if factor == 2 else 2
+    if n > 1:
+        factors.append(n)
+    return factors
+
+def euler_phi(n: int) -> int:
+    """Return the number of primitive nth roots of unity, which is the degree of Phi_n."""
+    result = n
+    for p in prime_factors(n):
+        result = result // p * (p - 1)
+    return result
+
+def cyclotomic_coefficients(n: int) -> np.ndarray:
+    """Return the integer coefficients of the nth cyclotomic polynomial Phi_n.
+
+    Uses Phi_n(x) = Phi_r(x^(n/r)) with r the product of the distinct primes of
+    n, and Phi_r(x) = prod_{d | r} (1 - x^d)^mu(r/d) for r > 1. Since Phi_r is
+    palindromic, only its lower half is needed, and that is computed as a
+    truncated power series: multiplying by (1 - x^d) and dividing by it are
+    both single vectorized passes. The cost is O(2^k phi(n)) for n with k
+    distinct prime factors.
+
+    Returns:
+        An int64 array of the coefficients in increasing degree.
+    """
+    if n < 1:
+        raise ValueError(f"n must be a positive integer, got {n}")
+    if n == 1:
+        return np.array([-1, 1], dtype=np.int64)
+
+    primes = prime_factors(n)
+    r = prod(primes)
+    degree = euler_phi(r)
+    length = degree // 2 + 1
+
+    series = np.zeros(length, dtype=np.int64)
+    series[0] = 1
+    # Multiply before dividing so that every division is exact
+    for sign in (1, -1):
+        for size in range(len(primes) + 1):
+            # d = r / (product of `size` primes), and mu(r/d) = (-1)^size
+            if (-1) ** size != sign:
+                continue
+            for chosen in combinations(primes, size):
+                d = r // prod(chosen)
+                if d >= length:
+                    continue
+                if sign == 1:
+                    series[d:] -= series[:-d].copy()
+                else:
+                    # Dividing by (1 - x^d) adds every coefficient to the one d places later
+                    padded = np.zeros(-(-length // d) * d, dtype=np.int64)
+                    padded[:length] = series
+                    series = np.cumsum(padded.reshape(-1, d), axis=0).reshape(-1)[:length]
+
+    coefficients = np.concatenate([series, series[:degree + 1 - length][::-1]])
+    if r == n:
+        return coefficients
+    spread = np.zeros(degree * (n // r) + 1, dtype=np.int64)
+    spread[::n // r] = coefficients
+    return spread
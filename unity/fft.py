@@ -0,0 +1,123 @@
+from math import gcd
+from typing import Sequence
+
+import numpy as np
+
+from unity.twiddle import twiddle_table
+
+# Prime sizes up to this are transformed with a direct DFT matrix,
+# larger primes with Bluestein's algorithm
+MAX_DIRECT_RADIX = 64
+# Memory for the zero-padded rows Bluestein's algorithm transforms at once
+BLUESTEIN_BLOCK_BYTES = 64 * 2**20
+# Factors of two are taken this many at a time, since each level of
+# recursion costs far more in NumPy calls than the larger butterfly does
+POWER_OF_TWO_RADIX = 16
+
+def _smallest_prime_factor(n: int) -> int:
+    if n % 2 == 0:
+        return 2
+    factor = 3
+    while factor * factor <= n:
+        if n % factor == 0:
+            return factor
+        factor += 2
+    return n
+
+def _direct_dft(x: np.ndarray) -> np.ndarray:
+    n = x.shape[-1]
+    exponents = np.arange(n)
+    matrix = twiddle_table(n)[np.outer(exponents, exponents) % n]
+    return x @ matrix
+
+def _bluestein(x: np.ndarray) -> np.ndarray:
+    # With jk = (j^2 + k^2 - (k - j)^2) / 2, the DFT becomes a convolution with
+    # the chirp c_t = e^{i pi t^2 / n}, which is done with power-of-two FFTs
+    n = x.shape[-1]
+    t = np.arange(n, dtype=np.int64)
+    chirp = twiddle_table(2 * n)[(t * t) % (2 * n)]
+    size = 1 << (2 * n - 2).bit_length()
+
+    b = np.zeros(size, dtype=np.complex128)
+    b[:n] = chirp.conj()
+    b[size - n + 1:] = chirp[1:][::-1].conj()
+    kernel = dft(b)
+
+    # Rows are padded to twice their length or more, so they go a block at a time
+    rows = x.reshape(-1, n)
+    result = np.empty(rows.shape, dtype=np.complex128)
+    block = max(1, BLUESTEIN_BLOCK_BYTES // (16 * size))
+    for start in range(0, len(rows), block):
+        a = np.zeros((len(rows[start:start + block]), size), dtype=np.complex128)
+        a[:, :n] = rows[start:start + block] * chirp
+        spectrum = dft(a) * kernel
+        # Inverse transform through the forward one: idft(y) = conj(dft(conj(y))) / size
+        convolution = dft(spectrum.conj()).conj() / size
+        result[start:start + block] = convolution[:, :n] * chirp
+    return result.reshape(x.shape)
+
+def dft(x: np.ndarray) -> np.ndarray:
+    """Evaluate X[..., k] = sum_j x[..., j] e^{2 pi i jk/n} along the last axis.
+
+    A mixed-radix Cooley-Tukey FFT: n is split by its smallest prime factor
+    (up to POWER_OF_TWO_RADIX at once for factors of two), and the twiddle
+    factors come from the shared cache in unity.twiddle. Prime factors above
+    MAX_DIRECT_RADIX go through Bluestein's algorithm, so this runs in
+    O(n log n) for any n.
+    """
+    x = np.asarray(x, dtype=np.complex128)
+    n = x.shape[-1]
+    if n <= 1:
+        return x.copy()
+    p = _smallest_prime_factor(n)
+    if p == 2:
+        p = gcd(n, POWER_OF_TWO_RADIX)
+    if p == n:
+        return _direct_dft(x) if n <= MAX_DIRECT_RADIX else _bluestein(x)
+
+    # Transform the p interleaved subsequences x[j1::p] of length m together
+    m = n // p
+    batch = x.shape[:-1]
+    sub = dft(np.swapaxes(x.reshape(*batch, m, p), -1, -2))
+
+    # X[k1 + m k2] = sum_j1 (w_n^{j1 k1} sub[j1, k1]) w_p^{j1 k2}
+    sub *= twiddle_table(n)[np.outer(np.arange(p), np.arange(m))]
+    if p <= MAX_DIRECT_RADIX:
+        exponents = np.arange(p)
+        butterfly = twiddle_table(p)[np.outer(exponents, exponents) % p]
+        return (butterfly @ sub).reshape(*batch, n)
+    # A dense p x p butterfly would cost O(n p), so large primes go through Bluestein too
+    return np.swapaxes(dft(np.swapaxes(sub, -1, -2)), -1, -2).reshape(*batch, n)
+
+def evaluate_at_roots(coefficients: np.ndarray | Sequence, n: int | None = None) -> np.ndarray:
+    """Evaluate polynomials at all nth roots of unity with the FFT.
+
+    Args:
+        coefficients: Coefficients c_0, c_1, ... in increasing degree along the
+            last axis. A 2-D array evaluates one polynomial per row.
+        n: Which roots of unity to evaluate at. Defaults to the number of coefficients.
+
+    Returns:
+        Array of p(z_k) for k = 0..n-1, with the same leading shape as ``coefficients``.
+    """
+    c = np.asarray(coefficients, dtype=np.complex128)
+    n = c.shape[-1] if n is None else n
+    if n < 1:
+        raise ValueError(f"n must be a positive integer, got {n}")
+    # z_k^n = 1, so the coefficient of z^j adds to that of z^(j mod n)
+    padding = -c.shape[-1] % n
+    c = np.concatenate([c, np.zeros((*c.shape[:-1], padding), dtype=c.dtype)], axis=-1)
+    c = c.reshape(*c.shape[:-1], -1, n).sum(axis=-2)
+    return dft(c)
+
+def evaluate_many(polynomials: Sequence[Sequence], n: int) -> np.ndarray:
+    """Evaluate polynomials of different degrees at all nth roots of unity in one batch.
+
+    Returns:
+        A (len(polynomials), n) array whose row i holds polynomial i at z_0..z_{n-1}.
+    """
+    degree = max(len(p) for p in polynomials)
+    coefficients = np.zeros((len(polynomials), degree), dtype=np.complex128)
+    for row, p in zip(coefficients, polynomials):
+        row[:len(p)] = p
+    return evaluate_at_roots(coefficients, n)
@@ -0,0 +1,152 @@
+from math import gcd
+
+import numpy as np
+
+from unity.roots import _roots_at
+
+# Products of two residues below this stay inside int64
+_MAX_INT64_MODULUS = 3037000499
+
+def _mulmod(a: np.ndarray, b: int | np.ndarray, n: int) -> np.ndarray:
+    """Return a * b mod n for residues a and b without overflowing int64."""
+    if n <= _MAX_INT64_MODULUS:
+        return (a * b) % n
+    return ((a.astype(object) * b) % n).astype(np.int64)
+
+class Root:
+    """The root of unity z_k = e^{2 pi i k/n}, stored exactly as the exponent k mod n.
+
+    Multiplying roots adds exponents and powers multiply them, so every group
+    operation is integer arithmetic with no rounding.
+    """
+
+    __slots__ = ("k", "n")
+
+    def __init__(self, k: int, n: int):
+        if n < 1:
+            raise ValueError(f"n must be a positive integer, got {n}")
+        self.k = k % n
+        self.n = n
+
+    def _check(self, other: "Root") -> None:
+        if other.n != self.n:
+            raise ValueError(f"Cannot combine roots of unity of order {self.n} and {other.n}")
+
+    def __mul__(self, other: "Root") -> "Root":
+        if not isinstance(other, Root):
+            return NotImplemented
+        self._check(other)
+        return Root(self.k + other.k, self.n)
+
+    def __truediv__(self, other: "Root") -> "Root":
+        if not isinstance(other, Root):
+            return NotImplemented
+        self._check(other)
+        return Root(self.k - other.k, self.n)
+
+    def __pow__(self, exponent: int) -> "Root":
+        return Root(self.k * exponent, self.n)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Root) and self.k == other.k and self.n == other.n
+
+    def __hash__(self) -> int:
+        return hash((self.k, self.n))
+
+    def __repr__(self) -> str:
+        return f"Root({self.k}, {self.n})"
+
+    def inverse(self) -> "Root":
+        return Root(-self.k, self.n)
+
+    def order(self) -> int:
+        """Smallest m > 0 with z_k^m = 1."""
+        return self.n // gcd(self.k, self.n)
+
+    def is_primitive(self) -> bool:
+        return gcd(self.k, self.n) == 1
+
+    def orbit(self) -> "RootArray":
+        """The powers z_k^0, z_k^1, ... up to the order of z_k, i.e. the subgroup it generates."""
+        steps = np.arange(self.order(), dtype=np.int64)
+        return RootArray(_mulmod(steps, self.k, self.n), self.n)
+
+    def __complex__(self) -> complex:
+        return complex(_roots_at(np.array([self.k], dtype=np.int64), self.n)[0])
+
+class RootArray:
+    """Many nth roots of unity stored as an int64 array of exponents mod n.
+
+    Indexing with an integer gives a Root; slicing and fancy indexing give
+    another RootArray.
+    """
+
+    __slots__ = ("exponents", "n")
+
+    def __init__(self, exponents, n: int):
+        if n < 1:
+            raise ValueError(f"n must be a positive integer, got {n}")
+        self.exponents = np.asarray(exponents, dtype=np.int64) % n
+        self.n = n
+
+    @classmethod
+    def all(cls, n: int) -> "RootArray":
+        """z_0..z_{n-1}."""
+        return cls(np.arange(n, dtype=np.int64), n)
+
+    @classmethod
+    def primitive(cls, n: int) -> "RootArray":
+        """The primitive nth roots, i.e. the z_k with gcd(k, n) = 1."""
+        k = np.arange(n, dtype=np.int64)
+        return cls(k[np.gcd(k, n) == 1], n)
+
+    def __len__(self) -> int:
+        return len(self.exponents)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Root(int(self.exponents[index]), self.n)
+        return RootArray(self.exponents[index], self.n)
+
+    def __iter__(self):
+        return (Root(int(k), self.n) for k in self.exponents)
+
+    def __repr__(self) -> str:
+        return f"RootArray({self.exponents.tolist()}, {self.n})"
+
+    def _other_exponents(self, other) -> np.ndarray | int:
+        if isinstance(other, (Root, RootArray)):
+            if other.n != self.n:
+                raise ValueError(f"Cannot combine roots of unity of order {self.n} and {other.n}")
+            return other.k if isinstance(other, Root) else other.exponents
+        raise TypeError(f"Cannot multiply RootArray by {type(other).__name__}")
+
+    def __mul__(self, other) -> "RootArray":
+        return RootArray(self.exponents + self._other_exponents(other), self.n)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other) -> "RootArray":
+        return RootArray(self.exponents - self._other_exponents(other), self.n)
+
+    def __pow__(self, exponent: int) -> "RootArray":
+        return RootArray(_mulmod(self.exponents, exponent % self.n, self.n), self.n)
+
+    def __eq__(self, other) -> np.ndarray:
+        if not isinstance(other, (Root, RootArray)):
+            return NotImplemented
+        return (self.exponents == self._other_exponents(other)) & (other.n == self.n)
+
+    def inverse(self) -> "RootArray":
+        return RootArray(-self.exponents, self.n)
+
+    def orders(self) -> np.ndarray:
+        """Order of every root: n / gcd(k, n)."""
+        return self.n // np.gcd(self.exponents, self.n)
+
+    def is_primitive(self) -> np.ndarray:
+        return np.gcd(self.exponents, self.n) == 1
+
+    def values(self) -> np.ndarray:
+        """The roots as complex128 values."""
+        return _roots_at(self.exponents, self.n)
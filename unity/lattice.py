@@ -0,0 +1,119 @@
+from functools import lru_cache
+
+import numpy as np
+
+from unity.cyclotomic import prime_factors
+from unity.group import Root, RootArray
+
+def factorize(n: int) -> list[tuple[int, int]]:
+    """Return the prime factorization of n as (prime, exponent) pairs."""
+    factors = []
+    for p in prime_factors(n):
+        exponent = 0
+        while n % p == 0:
+            n //= p
+            exponent += 1
+        factors.append((p, exponent))
+    return factors
+
+class SubgroupLattice:
+    """The subgroups of the cyclic group of nth roots of unity and how they nest.
+
+    There is exactly one subgroup per divisor d of n: the dth roots of unity,
+    whose exponents are the multiples of n/d. H_a is inside H_b exactly when a
+    divides b, so the lattice is the divisor lattice of n. Subgroups are
+    identified by their position in the sorted divisor array (the divisor
+    index), and the Hasse diagram only keeps the covering pairs d -> d*p for
+    primes p, which is at most (number of divisors) * (number of primes) edges
+    and is built with vectorized lookups.
+
+    Args:
+        n: Order of the group.
+    """
+
+    def __init__(self, n: int):
+        if n < 1:
+            raise ValueError(f"n must be a positive integer, got {n}")
+        self.n = n
+        self.factors = factorize(n)
+
+        # Divisors together with their number of prime factors counted with multiplicity
+        divisors = np.ones(1, dtype=np.int64)
+        ranks = np.zeros(1, dtype=np.int64)
+        for p, exponent in self.factors:
+            powers = np.arange(exponent + 1)
+            divisors = np.outer(divisors, p ** powers).ravel()
+            ranks = np.add.outer(ranks, powers).ravel()
+        order = np.argsort(divisors)
+        self.divisors = divisors[order]
+        self.ranks = ranks[order]
+        self.divisors.flags.writeable = False
+        self.ranks.flags.writeable = False
+
+        # Covering pairs (index of d, index of d*p)
+        lower, upper = [], []
+        for p, _ in self.factors:
+            below = np.flatnonzero((n // self.divisors) % p == 0)
+            lower.append(below)
+            upper.append(np.searchsorted(self.divisors, self.divisors[below] * p))
+        if lower:
+            self.edges = np.stack([np.concatenate(lower), np.concatenate(upper)], axis=1)
+        else:
+            self.edges = np.empty((0, 2), dtype=np.int64)
+        self.edges.flags.writeable = False
+
+    def __len__(self) -> int:
+        return len(self.divisors)
+
+    def index(self, d: int) -> int:
+        """Position of the subgroup of order d in the divisor index."""
+        i = int(np.searchsorted(self.divisors, d))
+        if i == len(self.divisors) or self.divisors[i] != d:
+            raise ValueError(f"{d} does not divide {self.n}")
+        return i
+
+    def subgroup(self, d: int) -> RootArray:
+        """The subgroup of order d, i.e. the dth roots of unity."""
+        self.index(d)
+        return RootArray(np.arange(0, self.n, self.n // d, dtype=np.int64), self.n)
+
+    def generators(self, d: int) -> RootArray:
+        """The elements that generate the subgroup of order d on their own."""
+        self.index(d)
+        j = np.arange(d, dtype=np.int64)
+        return RootArray(j[np.gcd(j, d) == 1] * (self.n // d), self.n)
+
+    def subgroup_of(self, root: Root) -> int:
+        """Order of the subgroup generated by root, which is its orbit."""
+        if root.n != self.n:
+            raise ValueError(f"Root of order {root.n} is not in the group of order {self.n}")
+        return root.order()
+
+    def orbit(self, k: int) -> RootArray:
+        """Powers of z_k, in the order they are visited."""
+        return Root(k, self.n).orbit()
+
+    def contains(self, a: int, b: int) -> bool:
+        """Whether the subgroup of order a lies inside the subgroup of order b."""
+        self.index(a)
+        self.index(b)
+        return b % a == 0
+
+    def above(self, d: int) -> np.ndarray:
+        """Orders of the subgroups that directly contain the one of order d."""
+        i = self.index(d)
+        return self.divisors[self.edges[self.edges[:, 0] == i, 1]]
+
+    def below(self, d: int) -> np.ndarray:
+        """Orders of the maximal subgroups of the one of order d."""
+        i = self.index(d)
+        return self.divisors[self.edges[self.edges[:, 1] == i, 0]]
+
+    def levels(self) -> list[np.ndarray]:
+        """Divisors grouped by rank, from the trivial group up to the whole group."""
+        return [self.divisors[self.ranks == rank] for rank in range(int(self.ranks.max()) + 1)]
+
+@lru_cache(maxsize=64)
+def subgroup_lattice(n: int) -> SubgroupLattice:
+    """Return the subgroup lattice of the nth roots of unity, cached per n."""
+    return SubgroupLattice(n)
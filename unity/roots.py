@@ -0,0 +1,86 @@
+from typing import Sequence
+
+import numpy as np
+
+# i^q for q = 0..3; multiplying by these is exact in floating point
+_QUADRANT_ROTATIONS = np.array([1, 1j, -1, -1j])
+
+def _roots_at(k: np.ndarray, n: int | np.ndarray) -> np.ndarray:
+    """Return e^{2 pi i k/n} elementwise; n may be a scalar or an array like k."""
+    # 4k/n = quadrant + remainder/n, with the angle inside the quadrant (pi/2) * remainder/n
+    quadrant, remainder = np.divmod(4 * k, n)
+    # Angles past pi/4 are taken from the other end of the quadrant, swapping cos and sin
+    folded = 2 * remainder > n
+    remainder = np.where(folded, n - remainder, remainder)
+    angles = (np.pi / 2) * (remainder / n)
+    cos, sin = np.cos(angles), np.sin(angles)
+    roots = np.empty(len(angles), dtype=np.complex128)
+    roots.real = np.where(folded, sin, cos)
+    roots.imag = np.where(folded, cos, sin)
+
+    # Rotate by quadrant * pi/2
+    roots *= _QUADRANT_ROTATIONS[quadrant % 4]
+    return roots
+
+def roots_of_unity(n: int, start: int = 0, stop: int | None = None) -> np.ndarray:
+    """Return the nth roots of unity z_k = e^{2 pi i k/n} for start <= k < stop.
+
+    Each angle is reduced with integer arithmetic to [0, pi/4] before calling
+    cos and sin, and the result is moved back by exact symmetries. The roots are
+    therefore accurate to about half an ulp, and symmetric roots (z_k and
+    z_{n-k}, z_k and -z_{k+n/2}, ...) are exact mirror images of each other.
+
+    Args:
+        n: Which roots of unity to compute.
+        start: First index k.
+        stop: One past the last index k. If None, computes up to k = n - 1.
+
+    Returns:
+        A complex128 array of length stop - start.
+    """
+    if n < 1:
+        raise ValueError(f"n must be a positive integer, got {n}")
+    stop = n if stop is None else stop
+    return _roots_at(np.arange(start, stop, dtype=np.int64), n)
+
+def roots_of_unity_batch(ns: Sequence[int] | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the roots of unity for many n in one vectorized pass.
+
+    Args:
+        ns: The values of n, e.g. ``range(2, 9)``.
+
+    Returns:
+        A ragged result as ``(roots, offsets)``: the roots for ``ns[i]`` are
+        ``roots[offsets[i]:offsets[i + 1]]``, in the same order as roots_of_unity.
+    """
+    ns = np.asarray(ns, dtype=np.int64)
+    if np.any(ns < 1):
+        raise ValueError("every n must be a positive integer")
+    offsets = np.zeros(len(ns) + 1, dtype=np.int64)
+    np.cumsum(ns, out=offsets[1:])
+    n = np.repeat(ns, ns)
+    k = np.arange(offsets[-1], dtype=np.int64) - np.repeat(offsets[:-1], ns)
+    return _roots_at(k, n), offsets
+
+def iter_roots_batches(ns: Sequence[int], max_points: int = 1 << 22):
+    """Split a sweep over n into batches of at most ``max_points`` roots.
+
+    Sweeps such as n = 2..100000 have billions of roots in total, so they are
+    computed one batch at a time. A single n with more roots than
+    ``max_points`` forms a batch on its own.
+
+    Yields:
+        ``(batch_ns, roots, offsets)`` for consecutive groups of ``ns``, with
+        roots and offsets as returned by roots_of_unity_batch.
+    """
+    batch = []
+    points = 0
+    for n in ns:
+        if batch and points + n > max_points:
+            yield (batch, *roots_of_unity_batch(batch))
+            batch = []
+            points = 0
+        batch.append(n)
+        points += n
+    if batch:
+        yield (batch, *roots_of_unity_batch(batch))
@@ -0,0 +1,118 @@
+import os
+import struct
+from pathlib import Path
+
+import numpy as np
+
+from unity.cyclotomic import cyclotomic_coefficients
+from unity.roots import roots_of_unity
+
+# Where tables are stored, relative to the working directory
+STORE_DIR = Path(".cache/tables")
+
+# File layout: a 64-byte header followed by the raw little-endian array.
+#   magic (8s) | version (I) | kind (8s) | dtype (8s) | n (Q) | length (Q) | data offset (Q)
+MAGIC = b"UNITYTBL"
+VERSION = 1
+HEADER = struct.Struct("<8sI8s8sQQQ")
+DATA_OFFSET = 64
+
+# Roots are written this many at a time, so a table never has to fit in memory
+CHUNK_SIZE = 1 << 20
+
+TABLE_DTYPES = {
+    "roots": np.dtype("<c16"),
+    "cyclo": np.dtype("<i8"),
+}
+
+class TableHeader:
+    """Metadata stored at the start of every table file."""
+
+    def __init__(self, kind: str, dtype: np.dtype, n: int, length: int, offset: int = DATA_OFFSET):
+        self.kind = kind
+        self.dtype = dtype
+        self.n = n
+        self.length = length
+        self.offset = offset
+
+    def pack(self) -> bytes:
+        header = HEADER.pack(MAGIC, VERSION, self.kind.encode(), self.dtype.str.encode(),
+                             self.n, self.length, self.offset)
+        return header.ljust(self.offset, b"\0")
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "TableHeader":
+        magic, version, kind, dtype, n, length, offset = HEADER.unpack(data[:HEADER.size])
+        if magic != MAGIC:
+            raise ValueError("Not a table file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported table version {version}")
+        return cls(kind.rstrip(b"\0").decode(), np.dtype(dtype.rstrip(b"\0").decode()), n, length, offset)
+
+def write_table(path: Path, kind: str, n: int, chunks, length: int) -> None:
+    """Write a table file from an iterable of array chunks.
+
+    The file is written under a temporary name and renamed into place, so
+    readers in other processes never see a partial table.
+    """
+    dtype = TABLE_DTYPES[kind]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    written = 0
+    with open(tmp_path, 'wb') as f:
+        f.write(TableHeader(kind, dtype, n, length).pack())
+        for chunk in chunks:
+            data = np.ascontiguousarray(chunk, dtype=dtype)
+            f.write(data.tobytes())
+            written += len(data)
+    if written != length:
+        tmp_path.unlink()
+        raise ValueError(f"Expected {length} values for {kind} table of n={n}, got {written}")
+    os.replace(tmp_path, path)
+
+def open_table(path: Path) -> tuple[TableHeader, np.memmap]:
+    """Map a table file read-only. Processes mapping the same file share its pages."""
+    with open(path, 'rb') as f:
+        header = TableHeader.unpack(f.read(DATA_OFFSET))
+    data = np.memmap(path, dtype=header.dtype, mode='r', offset=header.offset, shape=(header.length,))
+    return header, data
+
+class TableStore:
+    """Root and cyclotomic coefficient tables kept on disk and memory-mapped.
+
+    The first request for a table computes and writes it; every later request,
+    from any process, maps the same file with no parsing or copying, and the
+    operating system's page cache holds a single copy in memory.
+
+    Args:
+        directory: Directory holding the table files.
+    """
+
+    def __init__(self, directory: Path | str = STORE_DIR):
+        self.directory = Path(directory)
+
+    def path(self, kind: str, n: int) -> Path:
+        return self.directory / f"{kind}_{n}.bin"
+
+    def _open(self, kind: str, n: int, compute) -> np.memmap:
+        path = self.path(kind, n)
+        if not path.exists():
+            compute(path)
+        header, data = open_table(path)
+        if header.kind != kind or header.n != n:
+            raise ValueError(f"{path} holds a {header.kind} table for n={header.n}")
+        return data
+
+    def roots(self, n: int) -> np.memmap:
+        """Return z_0..z_{n-1}, computing the table in chunks if it isn't stored yet."""
+        def compute(path):
+            chunks = (roots_of_unity(n, start, min(start + CHUNK_SIZE, n)) for start in range(0, n, CHUNK_SIZE))
+            write_table(path, "roots", n, chunks, n)
+        return self._open("roots", n, compute)
+
+    def cyclotomic(self, n: int) -> np.memmap:
+        """Return the coefficients of Phi_n in increasing degree."""
+        def compute(path):
+            coefficients = cyclotomic_coefficients(n)
+            write_table(path, "cyclo", n, [coefficients], len(coefficients))
+        return self._open("cyclo", n, compute)
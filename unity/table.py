@@ -0,0 +1,126 @@
+import json
+import os
+from math import gcd
+from pathlib import Path
+from typing import NamedTuple
+
+# Where computed tables are kept between runs, in the project directory
+TABLE_DIR = Path(__file__).resolve().parent.parent / ".cache/roots_table"
+# Significant digits stored for the numeric value of every root
+DIGITS = 50
+# Closed forms are only derived for reduced denominators up to this size;
+# beyond it the square-root expressions are too large to be useful as labels
+MAX_RADICAL_DENOMINATOR = 120
+# Longest closed form root_label() puts on screen by default, enough for
+# n = 5, 8 and 12; the 17th roots run to thousands of characters
+MAX_LABEL_LENGTH = 96
+
+FERMAT_PRIMES = (3, 5, 17, 257, 65537)
+
+class RootEntry(NamedTuple):
+    """One nth root of unity z_k = e^{2 pi i k/n}.
+
+    ``radical`` and ``latex`` hold the closed form in square roots, or None when
+    z_k has none. ``re`` and ``im`` are decimal strings with DIGITS significant digits.
+    """
+    k: int
+    radical: str | None
+    latex: str | None
+    re: str
+    im: str
+
+_tables: dict[int, list[RootEntry]] = {}
+
+def is_constructible(n: int) -> bool:
+    """Whether the nth roots of unity can be written with square roots alone.
+
+    By the Gauss-Wantzel theorem this holds exactly when n is a power of two
+    times a product of distinct Fermat primes.
+    """
+    while n % 2 == 0:
+        n //= 2
+    for p in FERMAT_PRIMES:
+        if n % p == 0:
+            n //= p
+    return n == 1
+
+def _compute_entry(n: int, k: int) -> RootEntry:
+    import mpmath
+    import sympy
+
+    with mpmath.workdps(DIGITS + 5):
+        re = mpmath.nstr(mpmath.cospi(mpmath.mpf(2 * k) / n), DIGITS)
+        im = mpmath.nstr(mpmath.sinpi(mpmath.mpf(2 * k) / n), DIGITS)
+
+    radical = latex = None
+    if n <= MAX_RADICAL_DENOMINATOR and is_constructible(n):
+        angle = 2 * sympy.pi * sympy.Rational(k, n)
+        expr = sympy.cos(angle).rewrite(sympy.sqrt) + sympy.I * sympy.sin(angle).rewrite(sympy.sqrt)
+        if not expr.has(sympy.cos, sympy.sin):
+            radical = str(expr)
+            latex = sympy.latex(expr)
+    return RootEntry(k, radical, latex, re, im)
+
+def _compute_table(n: int) -> list[RootEntry]:
+    entries = []
+    for k in range(n):
+        g = gcd(k, n)
+        if g > 1:
+            # z_k of n is z_{k/g} of n/g, which is usually already cached
+            entries.append(roots_table(n // g)[k // g]._replace(k=k))
+        elif k > n // 2:
+            # z_{n-k} is the complex conjugate of z_k
+            mirror = entries[n - k]
+            entries.append(_conjugate(mirror, k))
+        else:
+            entries.append(_compute_entry(n, k))
+    return entries
+
+def _conjugate(entry: RootEntry, k: int) -> RootEntry:
+    import sympy
+
+    radical = latex = None
+    if entry.radical is not None:
+        expr = sympy.conjugate(sympy.sympify(entry.radical))
+        radical = str(expr)
+        latex = sympy.latex(expr)
+    im = entry.im[1:] if entry.im.startswith("-") else "-" + entry.im
+    return RootEntry(k, radical, latex, entry.re, im)
+
+def roots_table(n: int) -> list[RootEntry]:
+    """Return the closed forms and high-precision values of all nth roots of unity.
+
+    Tables are computed once with SymPy and mpmath, saved under TABLE_DIR and
+    then shared by every scene and process that asks for the same n.
+    """
+    if n < 1:
+        raise ValueError(f"n must be a positive integer, got {n}")
+    if n in _tables:
+        return _tables[n]
+
+    path = TABLE_DIR / f"{n}.json"
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entries = [RootEntry(*entry) for entry in json.load(f)]
+    except (OSError, ValueError, TypeError):
+        entries = _compute_table(n)
+        TABLE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write to a private file first so concurrent renders never read a partial table
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump([list(entry) for entry in entries], f)
+        os.replace(tmp_path, path)
+
+    _tables[n] = entries
+    return entries
+
+def root_label(n: int, k: int, max_length: int | None = MAX_LABEL_LENGTH) -> str:
+    """Return a LaTeX label for z_k: its closed form if it has a short one, else e^{2 pi i k/n}.
+
+    Pass ``max_length=None`` to always get the closed form when there is one,
+    e.g. for a scene that shows a single 17th root across the whole frame.
+    """
+    latex = roots_table(n)[k % n].latex
+    if latex is not None and (max_length is None or len(latex) <= max_length):
+        return latex
+    return f"e^{{2\\pi i {k}/{n}}}"
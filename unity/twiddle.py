@@ -0,0 +1,85 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from unity.roots import roots_of_unity
+
+# Memory the shared cache may hold on to
+DEFAULT_MAX_BYTES = 64 * 2**20
+
+class TwiddleCache:
+    """An LRU cache of root-of-unity arrays with a byte budget.
+
+    The roots of unity of any divisor n of a cached N are every (N/n)-th
+    element of the roots of N, so they are served as strided views of the
+    larger array without computing or copying anything. Caching an N also
+    drops the arrays it makes redundant. All returned arrays are read-only.
+
+    Args:
+        max_bytes: Total size of the arrays the cache keeps alive. The least
+            recently used arrays are evicted to stay under it; arrays larger
+            than the whole budget are computed but not kept.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.views = 0
+        self.misses = 0
+        self._tables: OrderedDict[int, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, n: int) -> np.ndarray:
+        """Return the nth roots of unity z_0..z_{n-1}."""
+        with self._lock:
+            table = self._tables.get(n)
+            if table is not None:
+                self._tables.move_to_end(n)
+                self.hits += 1
+                return table
+
+            # Smallest cached multiple of n, for the densest view
+            multiples = [size for size in self._tables if size % n == 0]
+            if multiples:
+                size = min(multiples)
+                self._tables.move_to_end(size)
+                self.views += 1
+                return self._tables[size][::size // n]
+
+            self.misses += 1
+
+        table = roots_of_unity(n)
+        table.flags.writeable = False
+        with self._lock:
+            self._store(n, table)
+        return table
+
+    def _store(self, n: int, table: np.ndarray) -> None:
+        if table.nbytes > self.max_bytes or n in self._tables:
+            return
+        # Divisors of n are views of the new table from now on
+        for size in [size for size in self._tables if n % size == 0]:
+            self.nbytes -= self._tables.pop(size).nbytes
+        while self._tables and self.nbytes + table.nbytes > self.max_bytes:
+            _, evicted = self._tables.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+        self._tables[n] = table
+        self.nbytes += table.nbytes
+
+    def cached(self) -> list[int]:
+        """Return the n whose arrays are held, from least to most recently used."""
+        with self._lock:
+            return list(self._tables)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables.clear()
+            self.nbytes = 0
+
+_shared_cache = TwiddleCache()
+
+def twiddle_table(n: int) -> np.ndarray:
+    """Return all nth roots of unity as a read-only array from the process-wide cache."""
+    return _shared_cache.get(n)